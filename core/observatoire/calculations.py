@@ -10,8 +10,9 @@ La correction de parallaxe est maintenant gérée par la méthode abaque
 """
 import math
 from datetime import datetime, timedelta, timezone
-from typing import Tuple
+from typing import Optional, Sequence, Tuple
 
+import numpy as np
 from astropy.coordinates import SkyCoord, CIRS
 from astropy.time import Time
 import astropy.units as u
@@ -37,6 +38,11 @@ class AstronomicalCalculations:
         self.longitude = longitude
         self.tz_offset = tz_offset
 
+        # Trigonométrie de la latitude, constante pour le site
+        lat_rad = math.radians(latitude)
+        self._sin_lat = math.sin(lat_rad)
+        self._cos_lat = math.cos(lat_rad)
+
     # =========================================================================
     # UTILITAIRES
     # =========================================================================
@@ -53,6 +59,12 @@ class AstronomicalCalculations:
         from core.utils.angle_utils import normalize_angle_360
         return normalize_angle_360(angle)
 
+    def _vers_utc_naive(self, date_heure: datetime) -> datetime:
+        """Convertit une date (naive locale ou aware) en UTC naive."""
+        if date_heure.tzinfo is None:
+            return date_heure - timedelta(hours=self.tz_offset)
+        return date_heure.astimezone(timezone.utc).replace(tzinfo=None)
+
     # =========================================================================
     # CONVERSION DE COORDONNÉES
     # =========================================================================
@@ -75,12 +87,7 @@ class AstronomicalCalculations:
                                frame='icrs')
 
         # Convertir en temps Astropy
-        if date_heure.tzinfo is None:
-            dt_utc = date_heure - timedelta(hours=self.tz_offset)
-        else:
-            dt_utc = date_heure.astimezone(timezone.utc).replace(tzinfo=None)
-
-        temps_obs = Time(dt_utc, scale='utc')
+        temps_obs = Time(self._vers_utc_naive(date_heure), scale='utc')
 
         # Appliquer précession/nutation vers l'époque actuelle
         coord_jnow = coord_j2000.transform_to(CIRS(obstime=temps_obs))
@@ -89,15 +96,8 @@ class AstronomicalCalculations:
 
     def calculer_temps_sideral(self, date_heure: datetime) -> float:
         """Temps sidéral local (degrés) au méridien de l'observatoire."""
-        # Si datetime locale naive: convertir en UTC avec tz_offset
-        dt = date_heure
-        if dt.tzinfo is None:
-            dt_utc = dt - timedelta(hours=self.tz_offset)
-        else:
-            # si aware, la passer en UTC et enlever tzinfo pour le calcul
-            dt_utc = dt.astimezone(timezone.utc).replace(tzinfo=None)
-
-        JD = self._calculate_julian_day(dt_utc)
+        # Naive = heure locale (tz_offset), aware = convertie ; UTC naive pour le calcul
+        JD = self._calculate_julian_day(self._vers_utc_naive(date_heure))
         GMST_deg = self._calculate_greenwich_sidereal_time(JD)
         # LST = GMST + longitude (Est positif)
         return (GMST_deg + self.longitude) % 360.0
@@ -116,14 +116,12 @@ class AstronomicalCalculations:
         return JD
 
     @staticmethod
-    def _calculate_greenwich_sidereal_time(JD: float) -> float:
-        """GMST (degrés) – formule IAU approchée."""
+    def _calculate_greenwich_sidereal_time(JD):
+        """GMST (degrés) – formule IAU approchée (scalaire ou tableau NumPy)."""
         T = (JD - 2451545.0) / 36525.0
-        # GMST en secondes
+        # GMST en secondes ; le modulo (float ou NumPy) est déjà dans [0, 86400)
         GMST_sec = 67310.54841 + (876600.0 * 3600 + 8640184.812866) * T + 0.093104 * T ** 2 - 6.2e-6 * T ** 3
         GMST_sec %= 86400.0
-        if GMST_sec < 0:
-            GMST_sec += 86400.0
         return GMST_sec / 240.0  # 86400 s -> 360°, donc 1° = 240 s
 
     @staticmethod
@@ -171,17 +169,75 @@ class AstronomicalCalculations:
         ha = self.calculer_angle_horaire(ad_jnow, date_heure, deja_jnow=True)
         return self._convert_to_horizontal(ha, dec_jnow)
 
+    def calculer_coords_horizontales_batch(
+        self, ascension_droite: float, declinaison: float, dates: Sequence[datetime]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Version vectorisée de calculer_coords_horizontales sur plusieurs instants.
+
+        Une seule transformation Astropy J2000 -> JNOW (obstime tableau) puis
+        temps sidéral, angle horaire et trigonométrie en NumPy. Destinée aux
+        projections de trajectoire (dizaines à centaines de points).
+
+        Args:
+            ascension_droite: AD J2000 en degrés
+            declinaison: Déclinaison J2000 en degrés
+            dates: Instants d'observation (même convention que date_heure)
+
+        Returns:
+            Tuple (azimuts, altitudes) : tableaux NumPy en degrés
+        """
+        dates_utc = [self._vers_utc_naive(d) for d in dates]
+
+        coord_j2000 = SkyCoord(ra=ascension_droite * u.degree, dec=declinaison * u.degree,
+                               frame='icrs')
+        coord_jnow = coord_j2000.transform_to(CIRS(obstime=Time(dates_utc, scale='utc')))
+        ad_jnow = np.asarray(coord_jnow.ra.degree)
+        dec_jnow = np.asarray(coord_jnow.dec.degree)
+
+        # Temps sidéral local (même GMST que calculer_temps_sideral)
+        jd = np.array([self._calculate_julian_day(d) for d in dates_utc])
+        lst = (self._calculate_greenwich_sidereal_time(jd) + self.longitude) % 360.0
+
+        ha = (lst - ad_jnow + 180.0) % 360.0 - 180.0
+        return self._convert_to_horizontal_batch(ha, dec_jnow)
+
+    def _convert_to_horizontal_batch(
+        self, ha: np.ndarray, declinaison: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Équivalent vectorisé de _convert_to_horizontal (réfraction incluse)."""
+        ha_rad = np.radians(ha)
+        dec_rad = np.radians(declinaison)
+        sin_lat, cos_lat = self._sin_lat, self._cos_lat
+
+        sin_alt = sin_lat * np.sin(dec_rad) + cos_lat * np.cos(dec_rad) * np.cos(ha_rad)
+        alt_deg = np.degrees(np.arcsin(sin_alt))
+
+        az_rad = np.arctan2(
+            np.sin(ha_rad),
+            np.cos(ha_rad) * sin_lat - np.tan(dec_rad) * cos_lat
+        )
+        az_deg = (np.degrees(az_rad) + 180) % 360
+
+        altitude_min = np.maximum(alt_deg, 0.0)
+        refraction_deg = 1.02 / 60 / np.tan(
+            np.radians(altitude_min + 10.3 / 60 / (altitude_min + 5.11))
+        )
+        alt_deg = np.where(alt_deg < -0.5, alt_deg, alt_deg + refraction_deg)
+
+        return az_deg, alt_deg
+
     def _convert_to_horizontal(self, ha: float, declinaison: float) -> Tuple[float, float]:
         """Effectue la conversion vers les coordonnées horizontales."""
         ha_rad = math.radians(ha)
         dec_rad = math.radians(declinaison)
-        lat_rad = math.radians(self.latitude)
+        sin_lat, cos_lat = self._sin_lat, self._cos_lat
 
-        sin_alt = math.sin(lat_rad) * math.sin(dec_rad) + math.cos(lat_rad) * math.cos(dec_rad) * math.cos(ha_rad)
+        sin_alt = sin_lat * math.sin(dec_rad) + cos_lat * math.cos(dec_rad) * math.cos(ha_rad)
         alt_rad = math.asin(sin_alt)
 
         numerator = math.sin(ha_rad)
-        denominator = math.cos(ha_rad) * math.sin(lat_rad) - math.tan(dec_rad) * math.cos(lat_rad)
+        denominator = math.cos(ha_rad) * sin_lat - math.tan(dec_rad) * cos_lat
 
         if denominator == 0:
             az_rad = math.pi / 2 if numerator > 0 else 3 * math.pi / 2
@@ -206,7 +262,8 @@ class AstronomicalCalculations:
         return altitude_deg + refraction_deg
 
     def calculer_heure_passage_meridien(self, ad_deg: float, date_reference: datetime,
-                                        declinaison: float = 0.0) -> datetime:
+                                        declinaison: float = 0.0,
+                                        angle_horaire: Optional[float] = None) -> datetime:
         """Calcule l'heure exacte du passage au méridien pour un objet.
 
         Utilise le même calcul que le countdown (HA → secondes) pour
@@ -216,10 +273,15 @@ class AstronomicalCalculations:
             ad_deg: Ascension droite en degrés (J2000)
             date_reference: Date/heure de référence
             declinaison: Déclinaison en degrés (J2000), pour la précession
+            angle_horaire: Angle horaire déjà calculé pour date_reference
+                           (évite une seconde conversion J2000 -> JNOW)
         """
-        ha = self.calculer_angle_horaire(
-            ad_deg, date_reference, deja_jnow=False, declinaison=declinaison
-        )
+        if angle_horaire is not None:
+            ha = angle_horaire
+        else:
+            ha = self.calculer_angle_horaire(
+                ad_deg, date_reference, deja_jnow=False, declinaison=declinaison
+            )
         # Secondes sidérales converties en solaires (facteur 239.3447)
         seconds_to_transit = -ha * 239.3447
         return date_reference + timedelta(seconds=round(seconds_to_transit))
@@ -46,6 +46,8 @@ class GestionnaireCatalogue:
         """
         self.objets: Dict[str, Dict[str, Any]] = {}  # Catalogue local
         self.cache_file: Path = CACHE_FILE  # Fichier de cache
+        # Date de modification du cache lors de la dernière lecture/écriture
+        self._cache_mtime_ns: Optional[int] = None
         
         # Charger le cache s'il existe
         self._charger_cache()
@@ -66,6 +68,7 @@ class GestionnaireCatalogue:
         Si le fichier de cache existe, tente de le charger dans le dictionnaire
         d'objets. En cas d'erreur, initialise un dictionnaire vide.
         """
+        self._cache_mtime_ns = self._mtime_cache_ns()
         if self.cache_file.exists():
             try:
                 with open(self.cache_file, 'r', encoding='utf-8') as f:
@@ -87,9 +90,37 @@ class GestionnaireCatalogue:
             
             with open(self.cache_file, 'w', encoding='utf-8') as f:
                 json.dump(self.objets, f, indent=2, ensure_ascii=False)
+            self._cache_mtime_ns = self._mtime_cache_ns()
         except Exception as e:
             logger.warning(f"Erreur lors de la sauvegarde du cache: {e}")
 
+    def _mtime_cache_ns(self) -> Optional[int]:
+        """Date de modification du fichier cache (None s'il n'existe pas)."""
+        try:
+            return self.cache_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def recharger_si_modifie(self) -> bool:
+        """
+        Recharge le cache si le fichier a changé depuis la dernière lecture.
+
+        Le fichier est aussi écrit par d'autres processus (interface web).
+        S'il a été supprimé, le catalogue local est vidé.
+
+        Returns:
+            True si le catalogue a été rechargé ou vidé
+        """
+        mtime_ns = self._mtime_cache_ns()
+        if mtime_ns == self._cache_mtime_ns:
+            return False
+        if mtime_ns is None:
+            self.objets = {}
+            self._cache_mtime_ns = None
+        else:
+            self._charger_cache()
+        return True
+
 
     def get_objets_disponibles(self) -> List[Dict[str, Any]]:
         """
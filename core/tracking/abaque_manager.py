@@ -12,8 +12,10 @@ L'abaque est basée sur des mesures réelles qui prennent en compte :
 - Tous les effets physiques réels du système
 """
 
+import bisect
 import json
 import logging
+import math
 from pathlib import Path
 from typing import Dict, Tuple
 
@@ -21,6 +23,16 @@ import numpy as np
 import openpyxl
 
 
+def _interp_angle(angle1: float, angle2: float, frac: float) -> float:
+    """Interpolation linéaire entre deux angles avec gestion de la circularité."""
+    delta = angle2 - angle1
+    if delta > 180:
+        delta -= 360
+    elif delta < -180:
+        delta += 360
+    return (angle1 + frac * delta) % 360
+
+
 class AbaqueManager:
     """
     Gère l'abaque empirique pour le positionnement de la coupole.
@@ -47,6 +59,11 @@ class AbaqueManager:
         
         # Interpolateur 2D
         self.interpolator = None
+
+        # Grille 2-D des azimuts coupole [altitude][azimut astre]
+        self._grid_rows = None
+        self._alt_axis = None
+        self._az_axis = None
         
         # Statistiques
         self.n_altitudes = 0
@@ -170,50 +187,62 @@ class AbaqueManager:
         self._alt_grid = alt_grid
         self._az_grid = az_grid
         self._data_dict = self.data_by_altitude
+        self._build_value_grid()
 
         self.logger.info(f"Grille créée {len(alt_grid)}x{len(az_grid)} (interpolation manuelle)")
 
+    def _build_value_grid(self):
+        """
+        Pré-calcule la grille des azimuts coupole.
+
+        _grid_rows[i][j] = azimut coupole mesuré pour (_alt_grid[i], _az_grid[j]),
+        NaN si le point n'a pas été mesuré. Évite de rechercher les valeurs
+        dans les listes brutes à chaque interpolation.
+        """
+        # Lignes et axes en floats Python : accès scalaire plus rapide que NumPy
+        nan = float('nan')
+        rows = []
+        for altitude in self._alt_grid:
+            data = self._data_dict[altitude]
+            valeurs = dict(zip(data['az_astre'], data['az_coupole']))
+            rows.append([float(valeurs.get(azimut, nan)) for azimut in self._az_grid])
+        self._grid_rows = rows
+        self._alt_axis = [float(a) for a in self._alt_grid]
+        self._az_axis = [float(a) for a in self._az_grid]
+
     def _interpolate_circular(self, alt, az):
         """Interpolation bilinéaire avec gestion angles circulaires."""
-        # Trouver indices grille
-        i_alt = np.searchsorted(self._alt_grid, alt) - 1
-        i_az = np.searchsorted(self._az_grid, az) - 1
+        if self._grid_rows is None:
+            self._build_value_grid()
+        alt_axis, az_axis = self._alt_axis, self._az_axis
+
+        # Trouver indices grille (bisect_left ≡ np.searchsorted, sans l'aller-retour NumPy)
+        i_alt = bisect.bisect_left(alt_axis, alt) - 1
+        i_az = bisect.bisect_left(az_axis, az) - 1
 
         # Bornes
-        i_alt = max(0, min(i_alt, len(self._alt_grid) - 2))
-        i_az = max(0, min(i_az, len(self._az_grid) - 2))
+        i_alt = max(0, min(i_alt, len(alt_axis) - 2))
+        i_az = max(0, min(i_az, len(az_axis) - 2))
 
-        alt1, alt2 = self._alt_grid[i_alt], self._alt_grid[i_alt + 1]
-        az1, az2 = self._az_grid[i_az], self._az_grid[i_az + 1]
+        alt1, alt2 = alt_axis[i_alt], alt_axis[i_alt + 1]
+        az1, az2 = az_axis[i_az], az_axis[i_az + 1]
 
         # Récupérer les 4 valeurs
-        def get_val(altitude, azimut):
-            data = self._data_dict[altitude]
-            idx = list(data['az_astre']).index(azimut)
-            return data['az_coupole'][idx]
-
-        v11 = get_val(alt1, az1)
-        v12 = get_val(alt1, az2)
-        v21 = get_val(alt2, az1)
-        v22 = get_val(alt2, az2)
-
-        # Interpolation avec gestion circularité
-        def interp_angle(angle1, angle2, frac):
-            delta = angle2 - angle1
-            if delta > 180:
-                delta -= 360
-            elif delta < -180:
-                delta += 360
-            return (angle1 + frac * delta) % 360
+        ligne1 = self._grid_rows[i_alt]
+        ligne2 = self._grid_rows[i_alt + 1]
+        v11, v12 = ligne1[i_az], ligne1[i_az + 1]
+        v21, v22 = ligne2[i_az], ligne2[i_az + 1]
+        if math.isnan(v11 + v12 + v21 + v22):
+            raise ValueError(f"Point manquant dans l'abaque autour de ({alt}, {az})")
 
         # Interpolation azimut
         frac_az = (az - az1) / (az2 - az1)
-        v1 = interp_angle(v11, v12, frac_az)
-        v2 = interp_angle(v21, v22, frac_az)
+        v1 = _interp_angle(v11, v12, frac_az)
+        v2 = _interp_angle(v21, v22, frac_az)
 
         # Interpolation altitude
         frac_alt = (alt - alt1) / (alt2 - alt1)
-        return interp_angle(v1, v2, frac_alt)
+        return _interp_angle(v1, v2, frac_alt)
 
     def get_dome_position(
         self,
@@ -272,9 +272,9 @@ def build_lookahead_trajectory(
     """
     trajectory: list[TrajectoryPoint] = []
     n_steps = duration_sec // sampling_sec + 1
-    for i in range(n_steps):
-        t = sim_start + timedelta(seconds=i * sampling_sec)
-        az, alt = calc.calculer_coords_horizontales(ra_j2000, dec_j2000, t)
+    times = [sim_start + timedelta(seconds=i * sampling_sec) for i in range(n_steps)]
+    az_arr, alt_arr = calc.calculer_coords_horizontales_batch(ra_j2000, dec_j2000, times)
+    for i, (az, alt) in enumerate(zip(az_arr.tolist(), alt_arr.tolist())):
         dome_target, _ = abaque.get_dome_position(alt, az)
         trajectory.append(
             TrajectoryPoint(
@@ -299,14 +299,12 @@ def find_meridian_time(
     Gère aussi bien les objets subpolaires (culmination à az=180°) que
     circumpolaires (culmination à az=0°). Affinage à 10 s près autour du max.
     """
-    best_t, best_alt = search_start, -90.0
     total_minutes = window_hours * 60
-    for i in range(total_minutes):
-        t = search_start + timedelta(minutes=i)
-        _, alt = calc.calculer_coords_horizontales(ra_j2000, dec_j2000, t)
-        if alt > best_alt:
-            best_alt = alt
-            best_t = t
+    times = [search_start + timedelta(minutes=i) for i in range(total_minutes)]
+    _, alts = calc.calculer_coords_horizontales_batch(ra_j2000, dec_j2000, times)
+    i_best = int(alts.argmax())
+    best_t, best_alt = times[i_best], float(alts[i_best])
+    # Affinage séquentiel : chaque amélioration recentre la fenêtre (non vectorisable)
     for i in range(-60, 60):
         t = best_t + timedelta(seconds=i * 10)
         _, alt = calc.calculer_coords_horizontales(ra_j2000, dec_j2000, t)
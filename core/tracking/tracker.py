@@ -12,7 +12,9 @@ Architecture Mixin (v4.5):
 """
 
 import logging
+import time
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Tuple, Optional
 
 from core.config.config import (
@@ -21,9 +23,11 @@ from core.config.config import (
     SINGLE_SPEED_MOTOR_DELAY,
 )
 from core.hardware.daemon_encoder_reader import get_daemon_reader
+from core.hardware.hardware_detector import HardwareDetector
 from core.hardware.moteur_rp2040 import MoteurRP2040
 from core.hardware.moteur_simule import MoteurSimule
 from core.observatoire import AstronomicalCalculations
+from core.tracking.abaque_manager import AbaqueManager
 from core.tracking.tracking_logger import TrackingLogger
 
 # Mixins
@@ -35,6 +39,25 @@ from core.tracking.tracking_meridian_anticipation_mixin import (
 )
 
 
+# Persistance des sessions (web.session), importée au premier arrêt de suivi.
+# L'échec d'import est aussi mémorisé : sans Django, Python relancerait
+# la recherche du module à chaque arrêt.
+_session_storage = None
+_session_storage_unavailable = False
+
+
+def _get_session_storage():
+    """Retourne web.session.session_storage, ou None si indisponible."""
+    global _session_storage, _session_storage_unavailable
+    if _session_storage is None and not _session_storage_unavailable:
+        try:
+            from web.session import session_storage
+            _session_storage = session_storage
+        except ImportError:
+            _session_storage_unavailable = True
+    return _session_storage
+
+
 class TrackingSession(
     TrackingStateMixin,
     TrackingGotoMixin,
@@ -55,6 +78,23 @@ class TrackingSession(
     # Mapping des icônes de mode (conservé pour compat UI — un seul mode reste)
     MODE_ICONS = {"continuous": "🔴"}
     MODE_NAME = "continuous"
+    MODE_ICON = MODE_ICONS.get(MODE_NAME, "⚪")  # Résolue une fois (mode fixe)
+
+    # Durée de validité du statut mis en cache (l'UI peut interroger plusieurs fois/s)
+    STATUS_CACHE_TTL_S = 0.5
+
+    # Interpolation Az/Alt entre deux ancres calculées exactement (voir
+    # _calculate_current_coords). Hors de la plage d'altitude (zénith : azimut
+    # non linéaire ; horizon : réfraction), calcul exact à chaque appel.
+    COORDS_ANCHOR_INTERVAL_S = 60.0
+    COORDS_INTERP_ALT_RANGE = (5.0, 80.0)
+
+    # RA/Dec d'une planète réutilisées dans une même tranche de temps : la Lune,
+    # la plus rapide, se déplace de moins de 0.01° en 60 s.
+    PLANET_RADEC_BUCKET_S = 60
+
+    # Nombre max d'interpolations abaque mémorisées (voir _calculate_target_position)
+    TARGET_MEMO_MAX = 4096
 
     def __init__(
         self,
@@ -86,17 +126,41 @@ class TrackingSession(
                           - delta: déplacement à effectuer
         """
         self.moteur = moteur
+        # Pas moteur par degré coupole (steps_per_dome_revolution fixé à la construction du moteur)
+        self._steps_per_degree = moteur.steps_per_dome_revolution / 360.0
         self.calc = calc
+        # Coordonnées du site, constantes pendant la session
+        self._lat = calc.latitude
+        self._lon = calc.longitude
         self.tracking_logger = logger  # TrackingLogger pour logs UI
         self.seuil = seuil
         self.intervalle = intervalle
         self.logger = logging.getLogger(__name__)  # Logger standard Python
         self.goto_callback = goto_callback
 
-        # Instance unique de PlanetaryEphemerides (évite de recréer à chaque correction)
-        from core.observatoire import PlanetaryEphemerides
+        # Dernier statut calculé (voir get_status)
+        self._status_cache = None
+        self._status_cache_time = 0.0
+        # Calcul brut réutilisable par le prochain get_status (voir _prime_status_cache)
+        self._status_prime = None
+
+        # Ancres d'interpolation Az/Alt (voir _calculate_current_coords)
+        self._coords_anchors = None
+        # Dernière position planétaire calculée : (tranche de temps, (ra, dec))
+        self._planet_radec = None
 
-        self._ephemerides = PlanetaryEphemerides()
+        # Clés constantes du statut, construites une fois (voir _build_status_dict)
+        self._status_template = {
+            "running": True,
+            "objet": None,
+            # Mode unique v5.10 — clés conservées pour compat UI
+            "adaptive_mode": self.MODE_NAME,
+            "adaptive_mode_description": "Mode unique - Vitesse max (v5.10)",
+            "adaptive_interval": SINGLE_SPEED_CHECK_INTERVAL_S,
+            "adaptive_threshold": SINGLE_SPEED_CORRECTION_THRESHOLD_DEG,
+            "adaptive_motor_delay": SINGLE_SPEED_MOTOR_DELAY,
+            "mode_icon": self.MODE_ICON,
+        }
 
         # Initialisation par étapes
         self._init_encoder(encoder_config)
@@ -124,20 +188,18 @@ class TrackingSession(
             self.logger.info("Encodeur désactivé dans configuration")
             return
 
-        from core.hardware.hardware_detector import HardwareDetector
-
         encoder_ok, encoder_error, _ = HardwareDetector.check_encoder_daemon()
 
         if not encoder_ok:
-            self.logger.warning(f"Encodeur config activé mais: {encoder_error}")
+            self.logger.warning("Encodeur config activé mais: %s", encoder_error)
             return
 
         try:
             pos = get_daemon_reader().read_angle(timeout_ms=200)
             self.encoder_available = True
-            self.logger.info(f"Encodeur actif - Position: {pos:.1f}°")
+            self.logger.info("Encodeur actif - Position: %.1f°", pos)
         except Exception as e:
-            self.logger.warning(f"Encodeur config activé mais démon inaccessible: {e}")
+            self.logger.warning("Encodeur config activé mais démon inaccessible: %s", e)
 
         if not self.encoder_available:
             self.logger.info("Mode position logicielle (relatif)")
@@ -147,9 +209,9 @@ class TrackingSession(
         if abaque_file is None:
             raise ValueError("abaque_file requis")
 
-        from core.tracking.abaque_manager import AbaqueManager
-
         self.abaque_manager = AbaqueManager(abaque_file)
+        # Interpolations mémorisées, propres à cette session et à cet abaque
+        self._target_memo = {}
 
         if not self.abaque_manager.load_abaque():
             raise RuntimeError("Échec du chargement de l'abaque")
@@ -161,16 +223,41 @@ class TrackingSession(
         Méthode CENTRALISÉE pour calculer Azimut/Altitude.
         Gère aussi bien les étoiles (Fixes J2000) que les planètes (Calcul dynamique).
 
+        Le calcul exact (Astropy) n'est fait qu'aux ancres, espacées de
+        COORDS_ANCHOR_INTERVAL_S ; entre deux ancres Az/Alt sont interpolés
+        linéairement (écart < 0.003° sur 60 s hors zénith).
+
         Args:
             now: Timestamp pour le calcul
 
         Returns:
             Tuple (azimut, altitude) en degrés
         """
+        t = now.timestamp()
+        anchors = self._coords_anchors
+        if anchors is not None:
+            t0, az0, alt0, t1, az1, alt1 = anchors
+            if t0 <= t <= t1:
+                frac = (t - t0) / (t1 - t0)
+                delta_az = (az1 - az0 + 180.0) % 360.0 - 180.0
+                return (az0 + frac * delta_az) % 360.0, alt0 + frac * (alt1 - alt0)
+
+        azimut, altitude = self._compute_current_coords(now)
+        self._coords_anchors = None
+
+        alt_min, alt_max = self.COORDS_INTERP_ALT_RANGE
+        if alt_min <= altitude <= alt_max:
+            interval = self.COORDS_ANCHOR_INTERVAL_S
+            az1, alt1 = self._compute_current_coords(now + timedelta(seconds=interval))
+            if alt_min <= alt1 <= alt_max:
+                self._coords_anchors = (t, azimut, altitude, t + interval, az1, alt1)
+
+        return azimut, altitude
+
+    def _compute_current_coords(self, now: datetime) -> Tuple[float, float]:
+        """Calcul exact Azimut/Altitude (sans interpolation)."""
         if self.is_planet:
-            planet_pos = self._ephemerides.get_planet_position(
-                self.objet.capitalize(), now, self.calc.latitude, self.calc.longitude
-            )
+            planet_pos = self._get_planet_radec(now)
             if planet_pos:
                 ra, dec = planet_pos
                 return self.calc.calculer_coords_horizontales(ra, dec, now)
@@ -179,24 +266,62 @@ class TrackingSession(
         # Cas standard (étoiles fixes ou fallback planète)
         return self.calc.calculer_coords_horizontales(self.ra_deg, self.dec_deg, now)
 
+    def _get_planet_radec(self, now: datetime) -> Optional[Tuple[float, float]]:
+        """
+        RA/Dec de la planète suivie, recalculées au plus une fois par tranche
+        de PLANET_RADEC_BUCKET_S (les éphémérides Astropy sont coûteuses).
+
+        Returns:
+            Tuple (ra, dec) en degrés, ou None si le calcul a échoué
+        """
+        bucket = int(now.timestamp() // self.PLANET_RADEC_BUCKET_S)
+        cached = self._planet_radec
+        if cached is not None and cached[0] == bucket:
+            return cached[1]
+
+        planet_pos = self._get_ephemerides().get_planet_position(
+            self._objet_cap, now, self._lat, self._lon
+        )
+        if planet_pos:
+            self._planet_radec = (bucket, planet_pos)
+        return planet_pos
+
     def _calculate_target_position(
         self, azimut_objet: float, altitude_objet: float
     ) -> Tuple[float, dict]:
         """
         Calcule la position cible de la coupole par interpolation de l'abaque.
 
+        Mémoïsé sur (altitude, azimut) quantifiés au 1/100° : les polls de
+        statut et la boucle de correction interrogent l'abaque à des
+        coordonnées quasi identiques (dérive lente). Les infos sont figées
+        (lecture seule) car partagées entre les appelants.
+
         Args:
             azimut_objet: Azimut de l'objet (degrés)
             altitude_objet: Altitude de l'objet (degrés)
 
         Returns:
-            Tuple (position_cible, infos_debug)
+            Tuple (position_cible, infos_debug) — infos_debug en lecture seule
         """
-        # Méthode abaque : interpolation des mesures réelles
-        position_cible, infos = self.abaque_manager.get_dome_position(altitude_objet, azimut_objet)
+        # Méthode abaque : interpolation des mesures réelles (mémoïsée au 1/100°)
+        alt_q = round(altitude_objet * 100) / 100
+        az_q = round(azimut_objet * 100) / 100
+        memo = self._target_memo
+        cached = memo.get((alt_q, az_q))
+        if cached is not None:
+            return cached
+
+        position_cible, infos = self.abaque_manager.get_dome_position(alt_q, az_q)
+        infos = dict(infos)
         infos["method"] = "abaque"
+        result = (position_cible, MappingProxyType(infos))
 
-        return position_cible, infos
+        if len(memo) >= self.TARGET_MEMO_MAX:
+            # Éviction de l'entrée la plus ancienne (ordre d'insertion)
+            del memo[next(iter(memo))]
+        memo[(alt_q, az_q)] = result
+        return result
 
     # =========================================================================
     # DÉMARRAGE DU SUIVI
@@ -223,12 +348,17 @@ class TrackingSession(
         Returns:
             Tuple (success, message)
         """
+        self._invalidate_status_cache()
+        self._coords_anchors = None
+        self._planet_radec = None
+
         # Rechercher et valider l'objet (Mixin TrackingGotoMixin)
         success, error_msg = self._rechercher_objet(objet_name)
         if not success:
             return False, error_msg
 
         now = datetime.now()
+        now_mono = time.monotonic()
 
         # Pour les planètes, mettre à jour RA/DEC (Mixin TrackingGotoMixin)
         if self.is_planet:
@@ -241,7 +371,7 @@ class TrackingSession(
 
         # Calculer positions initiales
         azimut, altitude = self._calculate_current_coords(now)
-        position_cible_init, _ = self._calculate_target_position(azimut, altitude)
+        position_cible_init, infos = self._calculate_target_position(azimut, altitude)
 
         # Vérifier si on doit faire un GOTO initial (Mixin TrackingGotoMixin)
         # Si skip_goto=True, on saute le GOTO (l'utilisateur a ajusté manuellement)
@@ -257,10 +387,10 @@ class TrackingSession(
         if skip_goto:
             # Utiliser la position réelle comme point de départ
             try:
-                real_position = get_daemon_reader().read_angle()
+                real_position = self._read_daemon_angle()
                 self._setup_initial_position(azimut, altitude, real_position)
                 self._sync_encoder(real_position)
-                self.logger.info(f"Position initiale depuis encodeur: {real_position:.1f}°")
+                self.logger.info("Position initiale depuis encodeur: %.1f°", real_position)
             except Exception:
                 # Fallback: utiliser la position cible calculée
                 self._setup_initial_position(azimut, altitude, position_cible_init)
@@ -272,44 +402,57 @@ class TrackingSession(
         # Si GOTO nécessaire, utiliser la vitesse unique (260 µs)
         if goto_needed:
             self.logger.info(
-                f"🎯 GOTO initial requis: {goto_delta:+.1f}° "
-                f"(vitesse unique {SINGLE_SPEED_MOTOR_DELAY * 1_000_000:.0f} µs/pas)"
+                "🎯 GOTO initial requis: %+.1f° (vitesse unique %.0f µs/pas)",
+                goto_delta, SINGLE_SPEED_MOTOR_DELAY * 1_000_000
             )
             # Exécuter le GOTO initial (Mixin TrackingGotoMixin)
             self._execute_initial_goto(position_cible_init, SINGLE_SPEED_MOTOR_DELAY)
-            self._start_tracking(objet_name, now, initial_interval=SINGLE_SPEED_CHECK_INTERVAL_S)
+            self._start_tracking(
+                objet_name, now, now_mono, initial_interval=SINGLE_SPEED_CHECK_INTERVAL_S
+            )
         else:
-            self._start_tracking(objet_name, now)
+            self._start_tracking(objet_name, now, now_mono)
 
         # Log et message de retour
-        self._log_start(objet_name, azimut, altitude, position_cible_init)
+        self._log_start(azimut, altitude, position_cible_init)
+        self._prime_status_cache(azimut, altitude, position_cible_init, infos, now_mono)
 
-        return True, self._format_start_message(objet_name, azimut, altitude, position_cible_init)
+        return True, self._format_start_message(azimut, altitude, position_cible_init)
 
-    def _start_tracking(self, objet_name: str, now: datetime, initial_interval: int = None):
-        """Active le suivi."""
+    def _start_tracking(
+        self, objet_name: str, now: datetime, now_mono: float, initial_interval: int = None
+    ):
+        """
+        Active le suivi.
+
+        now/now_mono sont lus au début de start() : la durée de session
+        inclut le GOTO initial.
+        """
         self.running = True
-        self.drift_tracking["start_time"] = now
-        self._last_milestone_time = now
+        self._set_start_time(now, now_mono)
+        self._status_template["objet"] = objet_name
+        self._last_milestone_mono = time.monotonic()
         # Utiliser l'intervalle adaptatif si fourni, sinon l'intervalle par défaut
         interval = initial_interval if initial_interval is not None else self.intervalle
-        self.next_correction_time = now + timedelta(seconds=interval)
+        self._schedule_next_correction(interval)
         self.tracking_logger.start_tracking(
             objet_name, f"{self.ra_deg:.2f}°", f"{self.dec_deg:.2f}°"
         )
 
-    def _check_session_milestone(self):
-        """Émet un log session_health toutes les 5 minutes pendant le tracking."""
-        if not self.running or not hasattr(self, '_last_milestone_time'):
+    def _check_session_milestone(self, now_mono: float):
+        """
+        Émet un log session_health toutes les 5 minutes pendant le tracking.
+
+        Args:
+            now_mono: Horloge monotone du tick (lue une seule fois par check_and_correct)
+        """
+        if not self.running or self._last_milestone_mono is None:
             return
 
-        now = datetime.now()
-        elapsed = (now - self._last_milestone_time).total_seconds()
-        if elapsed < 300:  # 5 minutes
+        if now_mono - self._last_milestone_mono < 300:  # 5 minutes
             return
 
-        start_time = self.drift_tracking.get('start_time', now)
-        duration_min = int((now - start_time).total_seconds() / 60)
+        duration_min = int((now_mono - self._start_mono) / 60)
         enc_status = 'ok' if self.encoder_available else 'lost'
 
         self.logger.info(
@@ -317,24 +460,24 @@ class TrackingSession(
             f"corrections={self.total_corrections} total_movement={self.total_movement:.1f} "
             f"mode={self.MODE_NAME} encoder={enc_status} failed={self.failed_feedback_count}"
         )
-        self._last_milestone_time = now
+        self._last_milestone_mono = now_mono
 
-    def _log_start(self, objet_name: str, azimut: float, altitude: float, position_cible: float):
+    def _log_start(self, azimut: float, altitude: float, position_cible: float):
         """Log le démarrage du suivi."""
         self.logger.info(
-            f"Méthode: ABAQUE | Az={azimut:.1f}° Alt={altitude:.1f}° | "
-            f"Position cible={position_cible % 360:.1f}°"
+            "Méthode: ABAQUE | Az=%.1f° Alt=%.1f° | Position cible=%.1f°",
+            azimut, altitude, position_cible
         )
 
     def _format_start_message(
-        self, objet_name: str, azimut: float, altitude: float, position_cible: float
+        self, azimut: float, altitude: float, position_cible: float
     ) -> str:
-        """Formate le message de démarrage."""
+        """Formate le message de démarrage (objet lu sur self.objet)."""
         return (
-            f"Suivi démarré : {objet_name}\n"
+            f"Suivi démarré : {self.objet}\n"
             f"  RA={self.ra_deg:.2f}° DEC={self.dec_deg:.2f}°\n"
             f"  Azimut: {azimut:.1f}° | Altitude: {altitude:.1f}°\n"
-            f"  Position coupole: {position_cible % 360:.1f}°\n"
+            f"  Position coupole: {position_cible:.1f}°\n"
             f"  Méthode: ABAQUE"
         )
 
@@ -346,26 +489,71 @@ class TrackingSession(
         """
         Retourne l'état actuel du suivi.
 
+        Le statut est mis en cache pendant STATUS_CACHE_TTL_S : des polls
+        rapprochés renvoient une copie du dernier statut sans recalculer
+        coordonnées ni interpolation abaque.
+
         Returns:
             Dictionnaire avec les informations de statut
         """
         if not self.running:
             return {"running": False}
 
-        now = datetime.now()
-        azimut, altitude = self._calculate_current_coords(now)
-        position_cible, infos = self._calculate_target_position(azimut, altitude)
+        now_mono = time.monotonic()
+        if (
+            self._status_cache is not None
+            and now_mono - self._status_cache_time < self.STATUS_CACHE_TTL_S
+        ):
+            return dict(self._status_cache)
+
+        # Calcul amorcé encore frais : réutilisé, lissé une seule fois ici
+        prime = self._status_prime
+        self._status_prime = None
+        if prime is not None and now_mono - prime[0] < self.STATUS_CACHE_TTL_S:
+            computed_at, azimut, altitude, position_cible, infos = prime
+        else:
+            computed_at = now_mono
+            now = datetime.now()
+            azimut, altitude = self._calculate_current_coords(now)
+            position_cible, infos = self._calculate_target_position(azimut, altitude)
 
-        remaining = self._calculate_remaining_time(now)
+        remaining = self._calculate_remaining_time()
 
-        return self._build_status_dict(
+        status = self._build_status_dict(
             azimut, altitude, position_cible, remaining, infos
         )
+        self._status_cache = status
+        self._status_cache_time = computed_at
+        return dict(status)
 
-    def _calculate_remaining_time(self, now: datetime) -> int:
+    def _prime_status_cache(
+        self,
+        azimut: float,
+        altitude: float,
+        position_cible: float,
+        infos: dict,
+        computed_at: float,
+    ):
+        """
+        Amorce le statut avec la position calculée par start() ou la correction.
+
+        Seul le calcul brut est conservé : le statut (et le lissage de
+        position_cible) n'est construit que si get_status() l'utilise, pour
+        n'ajouter qu'un échantillon par tick à la fenêtre de lissage.
+        L'horodatage est celui du calcul : après un long GOTO ou une
+        correction feedback, l'amorce est déjà expirée et ignorée.
+        """
+        self._status_cache = None
+        self._status_prime = (computed_at, azimut, altitude, position_cible, infos)
+
+    def _invalidate_status_cache(self):
+        """Force le recalcul du statut au prochain get_status()."""
+        self._status_cache = None
+        self._status_prime = None
+
+    def _calculate_remaining_time(self) -> int:
         """Calcule le temps restant avant prochaine correction."""
-        remaining = int((self.next_correction_time - now).total_seconds())
-        return max(0, remaining)
+        return max(0, int(self._next_correction_mono - time.monotonic()))
 
     def _build_status_dict(
         self,
@@ -375,34 +563,30 @@ class TrackingSession(
         remaining: int,
         infos: dict,
     ) -> dict:
-        """Construit le dictionnaire de statut."""
+        """
+        Construit le dictionnaire de statut.
+
+        Seuls les champs variables sont mis à jour dans _status_template ;
+        le résultat est une copie superficielle du gabarit.
+        """
         # Lisser la position cible (Mixin TrackingStateMixin)
         position_cible_lissee = self._smooth_position_cible(position_cible)
 
-        return {
-            "running": True,
-            "objet": self.objet,
-            "obj_az_raw": azimut,
-            "obj_alt": altitude,
-            "position_cible": position_cible_lissee,
-            "position_relative": self.position_relative % 360,
-            "remaining_seconds": remaining,
-            "total_corrections": self.total_corrections,
-            "total_movement": self.total_movement,
-            # Mode unique v5.10 — clés conservées pour compat UI
-            "adaptive_mode": self.MODE_NAME,
-            "adaptive_mode_description": "Mode unique - Vitesse max (v5.10)",
-            "adaptive_interval": SINGLE_SPEED_CHECK_INTERVAL_S,
-            "adaptive_threshold": SINGLE_SPEED_CORRECTION_THRESHOLD_DEG,
-            "adaptive_motor_delay": SINGLE_SPEED_MOTOR_DELAY,
-            "mode_icon": self.MODE_ICONS.get(self.MODE_NAME, "⚪"),
-            # Autres informations
-            "steps_correction_factor": self.steps_correction_factor,
-            "encoder_daemon": self.encoder_available,
-            "abaque_method": infos.get("method", "interpolation"),
-            "in_bounds": infos.get("in_bounds", True),
-            "encoder_offset": self.encoder_offset,
-        }
+        status = self._status_template
+        status["obj_az_raw"] = azimut
+        status["obj_alt"] = altitude
+        status["position_cible"] = position_cible_lissee
+        status["position_relative"] = self.position_relative
+        status["remaining_seconds"] = remaining
+        status["total_corrections"] = self.total_corrections
+        status["total_movement"] = self.total_movement
+        # Autres informations
+        status["steps_correction_factor"] = self.steps_correction_factor
+        status["encoder_daemon"] = self.encoder_available
+        status["abaque_method"] = infos.get("method", "interpolation")
+        status["in_bounds"] = infos.get("in_bounds", True)
+        status["encoder_offset"] = self.encoder_offset
+        return status.copy()
 
     # =========================================================================
     # ARRÊT DU SUIVI
@@ -414,7 +598,7 @@ class TrackingSession(
             self._log_session_summary()  # Mixin TrackingStateMixin
         except Exception as e:
             self.logger.error(
-                f"Erreur log_session_summary (session sera quand même sauvegardée): {e}"
+                "Erreur log_session_summary (session sera quand même sauvegardée): %s", e
             )
         self._save_session_to_file()  # Sauvegarde automatique — toujours exécuté
         self._finalize_stop()
@@ -427,10 +611,14 @@ class TrackingSession(
 
         Note: Couplage inverse avec web.session.session_storage — ce module core/
         importe un composant web/ pour la persistance. Acceptable car la sauvegarde
-        est optionnelle (protégée par try/except ImportError).
+        est optionnelle (module absent → sauvegarde ignorée, voir _get_session_storage).
         """
         try:
-            from web.session import session_storage
+            session_storage = _get_session_storage()
+            if session_storage is None:
+                # Module session non disponible (ex: tests sans Django)
+                self.logger.debug("Module session non disponible - sauvegarde ignorée")
+                return
 
             # Construire les données complètes
             session_data = self.get_session_data()  # Mixin TrackingStateMixin
@@ -442,25 +630,23 @@ class TrackingSession(
                 "dec_deg": self.dec_deg,
             }
 
-            # Ajouter l'heure de fin
+            # Ajouter l'heure de fin (start_time déjà au format ISO)
+            end_time = datetime.now().isoformat()
             session_data["timing"] = {
                 "start_time": session_data.pop("start_time"),
-                "end_time": datetime.now().isoformat(),
+                "end_time": end_time,
                 "duration_seconds": session_data.pop("duration_seconds"),
             }
 
             # Sauvegarder
             session_id = session_storage.save_session(session_data)
             if session_id:
-                self.logger.info(f"Session sauvegardée: {session_id}")
+                self.logger.info("Session sauvegardée: %s", session_id)
             else:
                 self.logger.warning("Échec sauvegarde session")
 
-        except ImportError:
-            # Module session non disponible (ex: tests sans Django)
-            self.logger.debug("Module session non disponible - sauvegarde ignorée")
         except Exception as e:
-            self.logger.warning(f"Erreur sauvegarde session: {e}")
+            self.logger.warning("Erreur sauvegarde session: %s", e)
 
     def _finalize_stop(self):
         """Finalise l'arrêt du suivi."""
@@ -472,7 +658,7 @@ class TrackingSession(
         )
         self.tracking_logger.stop_tracking("Manuel")
         self.logger.info(
-            f"Statistiques | Corrections: {self.total_corrections} | "
-            f"Mouvement total: {self.total_movement:.1f}° | "
-            f"Correction moyenne: {avg_correction:.2f}°"
+            "Statistiques | Corrections: %d | Mouvement total: %.1f° | "
+            "Correction moyenne: %.2f°",
+            self.total_corrections, self.total_movement, avg_correction
         )
@@ -12,8 +12,9 @@ suppression du mode adaptatif, du gel méridien GEM et du rattrapage
 meridian_catchup.
 """
 
+import logging
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Tuple
 
 from core.config.config import (
@@ -21,8 +22,14 @@ from core.config.config import (
     SINGLE_SPEED_CORRECTION_THRESHOLD_DEG,
     SINGLE_SPEED_MOTOR_DELAY,
 )
+from core.hardware.daemon_encoder_reader import get_daemon_reader
 from core.utils.angle_utils import shortest_angular_distance
 
+# Format commun des logs de résultat feedback (préfixe, positions, erreur, suffixe)
+_FEEDBACK_LOG_FMT = (
+    "%s: %.1f° -> %.1f° (erreur: %.2f°, AZCoupole: %.1f°, %d/10 iter, %.1fs)%s"
+)
+
 
 class TrackingCorrectionsMixin:
     """
@@ -57,29 +64,34 @@ class TrackingCorrectionsMixin:
             return False, "Suivi non actif"
 
         # Anticipation méridien (v5.9) — exécutée AVANT la logique abaque standard.
-        # Court-circuit silencieux si flag désactivé (schedule=None) ou déjà consommé.
-        now_utc = datetime.utcnow()
-        # Re-scan glissant : ré-évalue la fenêtre 1h périodiquement (throttle 5 min)
-        # tant qu'aucun schedule n'est armé. No-op si schedule en attente.
-        self._maybe_rescan_anticipation(now_utc)
-        if self._should_execute_anticipatory_slew(now_utc):
-            self._execute_anticipatory_slew()
-            # Après un slew massif, consommer l'intervalle avant la prochaine correction.
-            self.next_correction_time = datetime.now() + timedelta(
-                seconds=SINGLE_SPEED_CHECK_INTERVAL_S
-            )
-            return True, "meridian_anticipation_slew_executed"
+        # Flag désactivé : aucun schedule possible, on saute le hook sans même
+        # lire l'horloge UTC. Sinon court-circuit si schedule absent ou consommé.
+        if self._anticipation_enabled:
+            now_utc = datetime.utcnow()
+            # Re-scan glissant : ré-évalue la fenêtre 1h périodiquement (throttle 5 min)
+            # tant qu'aucun schedule n'est armé. No-op si schedule en attente.
+            self._maybe_rescan_anticipation(now_utc)
+            if self._should_execute_anticipatory_slew(now_utc):
+                self._execute_anticipatory_slew()
+                self._invalidate_status_cache()
+                self._invalidate_daemon_cache()
+                # Après un slew massif, consommer l'intervalle avant la prochaine correction.
+                self._schedule_next_correction(SINGLE_SPEED_CHECK_INTERVAL_S)
+                return True, "meridian_anticipation_slew_executed"
+
+        # Horloge du tick, lue une seule fois (milestone + échéance de correction)
+        now_mono = time.monotonic()
 
         # Session milestone (toutes les 5 min)
-        self._check_session_milestone()
-
-        now = datetime.now()
+        self._check_session_milestone(now_mono)
 
         # Vérifier si c'est le moment de faire une correction
         # (respecte l'intervalle configuré, même si appelé plus fréquemment)
-        if self.next_correction_time and now < self.next_correction_time:
+        if now_mono < self._next_correction_mono:
             return False, ""  # Pas encore le moment
 
+        now = datetime.now()
+
         # Calculer la position actuelle de l'objet (méthode centralisée)
         azimut, altitude = self._calculate_current_coords(now)
 
@@ -92,24 +104,25 @@ class TrackingCorrectionsMixin:
         # Détection explicite du transit méridien (log informatif)
         if abs(delta) > self.LARGE_MOVEMENT_THRESHOLD:
             self.logger.info(
-                f"meridian_transit | delta={delta:+.1f} az={azimut:.1f} alt={altitude:.1f} "
-                f"from={self.position_relative:.1f} to={position_cible:.1f}"
+                "meridian_transit | delta=%+.1f az=%.1f alt=%.1f from=%.1f to=%.1f",
+                delta, azimut, altitude, self.position_relative, position_cible
             )
             self._log_goto(self.position_relative, position_cible, delta, 'meridian_transit')
 
         # Vérifier si la correction dépasse le seuil (vitesse unique)
         if abs(delta) < SINGLE_SPEED_CORRECTION_THRESHOLD_DEG:
-            self.next_correction_time = now + timedelta(seconds=SINGLE_SPEED_CHECK_INTERVAL_S)
-            self.logger.debug(
+            self._schedule_next_correction(SINGLE_SPEED_CHECK_INTERVAL_S)
+            # Le get_status() qui suit dans le même tick réutilise ce calcul
+            self._prime_status_cache(azimut, altitude, position_cible, infos, now_mono)
+            # Message formaté une seule fois : renvoyé et réutilisé par le log DEBUG
+            skip_message = (
                 f"correction_skip | delta={delta:+.2f} "
-                f"threshold={SINGLE_SPEED_CORRECTION_THRESHOLD_DEG:.2f} "
-                f"next_check={SINGLE_SPEED_CHECK_INTERVAL_S}s"
+                f"threshold={SINGLE_SPEED_CORRECTION_THRESHOLD_DEG:.2f}"
             )
-            return (
-                False,
-                f"correction_skip | delta={delta:+.2f} "
-                f"threshold={SINGLE_SPEED_CORRECTION_THRESHOLD_DEG:.2f}",
+            self.logger.debug(
+                "%s next_check=%ss", skip_message, SINGLE_SPEED_CHECK_INTERVAL_S
             )
+            return False, skip_message
 
         # === APPLIQUER LA CORRECTION (vitesse unique) ===
         self._apply_correction(delta, SINGLE_SPEED_MOTOR_DELAY)
@@ -125,7 +138,7 @@ class TrackingCorrectionsMixin:
         self.logger.info(log_message)
 
         # === Ajouter à l'historique de dérive ===
-        self.drift_tracking['corrections_log'].append({
+        self._log_correction({
             'timestamp': now.isoformat(),
             'azimut': round(azimut, 2),
             'altitude': round(altitude, 2),
@@ -147,10 +160,21 @@ class TrackingCorrectionsMixin:
         self.correction_history.append(delta)
 
         # Prochaine vérification
-        self.next_correction_time = now + timedelta(seconds=SINGLE_SPEED_CHECK_INTERVAL_S)
+        self._schedule_next_correction(SINGLE_SPEED_CHECK_INTERVAL_S)
+        # Horodaté avant le mouvement : ignoré si la correction a duré plus que le TTL
+        self._prime_status_cache(azimut, altitude, position_cible, infos, now_mono)
 
         return True, log_message
 
+    def _schedule_next_correction(self, interval: float):
+        """
+        Planifie la prochaine vérification dans `interval` secondes.
+
+        L'échéance est une horloge monotone : comparaison float à chaque
+        poll, insensible aux sauts d'heure système (NTP) en longue session.
+        """
+        self._next_correction_mono = time.monotonic() + interval
+
     def _apply_correction(self, delta_deg: float, motor_delay: float = SINGLE_SPEED_MOTOR_DELAY):
         """
         Applique une correction AVEC FEEDBACK si encodeur disponible.
@@ -166,6 +190,10 @@ class TrackingCorrectionsMixin:
         else:
             self._apply_correction_sans_feedback(delta_deg, motor_delay)
 
+        # La position a changé : le statut et les lectures démon en cache ne sont plus valides
+        self._invalidate_status_cache()
+        self._invalidate_daemon_cache()
+
     def _apply_correction_avec_feedback(self, delta_deg: float, motor_delay: float):
         """Applique une correction avec feedback encodeur."""
         try:
@@ -216,9 +244,6 @@ class TrackingCorrectionsMixin:
 
     def _notify_degraded_mode(self):
         """Notifie l'utilisateur que le système fonctionne en mode dégradé."""
-        if not hasattr(self, '_degraded_mode_notified'):
-            self._degraded_mode_notified = False
-
         if not self._degraded_mode_notified:
             self.logger.warning(
                 "Mode dégradé: correction sans feedback encodeur"
@@ -243,7 +268,7 @@ class TrackingCorrectionsMixin:
             allow_large_movement: Si True, désactive la protection 20° du FeedbackController.
                                   Nécessaire pour les grands déplacements (traversée méridien).
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = self.moteur.rotation_avec_feedback(
             angle_cible=angle_cible,
             vitesse=motor_delay,
@@ -251,12 +276,12 @@ class TrackingCorrectionsMixin:
             max_iterations=10,
             allow_large_movement=allow_large_movement
         )
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         return result, duration
 
     def _finaliser_correction(self, delta_deg: float, position_cible: float):
         """Met à jour la position et les statistiques."""
-        self.position_relative = position_cible
+        self._set_position_relative(position_cible)
         self.total_corrections += 1
         self.total_movement += abs(delta_deg)
 
@@ -288,15 +313,20 @@ class TrackingCorrectionsMixin:
 
         self._log_detail_iterations(result)
 
+    def _log_feedback(self, level: int, prefix: str, result: dict,
+                      duration: float, suffix: str = ""):
+        """Log le résultat d'une correction feedback (formatage différé)."""
+        self.logger.log(
+            level, _FEEDBACK_LOG_FMT, prefix,
+            result['position_initiale'], result['position_finale'],
+            result['erreur_finale'], result['position_cible'],
+            result['iterations'], duration, suffix
+        )
+
     def _log_feedback_succes(self, result: dict, duration: float):
         """Log une correction feedback réussie."""
         self.failed_feedback_count = 0
-        self.logger.info(
-            f"Correction feedback réussie: {result['position_initiale']:.1f}° -> "
-            f"{result['position_finale']:.1f}° (erreur: {result['erreur_finale']:.2f}°, "
-            f"AZCoupole: {result['position_cible']:.1f}°, "
-            f"{result['iterations']}/10 iter, {duration:.1f}s)"
-        )
+        self._log_feedback(logging.INFO, "Correction feedback réussie", result, duration)
 
     def _log_feedback_timeout_acceptable(self, result: dict, duration: float):
         """
@@ -306,24 +336,17 @@ class TrackingCorrectionsMixin:
         qui dépassent le timeout mais atteignent la cible.
         On NE réinitialise PAS le compteur d'échecs mais on NE l'incrémente PAS non plus.
         """
-        self.logger.warning(
-            f"Correction longue mais acceptable: "
-            f"{result['position_initiale']:.1f}° -> {result['position_finale']:.1f}° "
-            f"(erreur: {result['erreur_finale']:.2f}° < {self.ACCEPTABLE_ERROR_THRESHOLD}°, "
-            f"AZCoupole: {result['position_cible']:.1f}°, "
-            f"{result['iterations']}/10 iter, {duration:.1f}s, timeout OK)"
+        self._log_feedback(
+            logging.WARNING, "Correction longue mais acceptable", result, duration,
+            f" [timeout OK, erreur < {self.ACCEPTABLE_ERROR_THRESHOLD}°]"
         )
 
     def _log_feedback_echec(self, result: dict, duration: float):
         """Log une correction feedback imprécise."""
         self.failed_feedback_count += 1
-        self.logger.warning(
-            f"Correction feedback imprécise: "
-            f"{result['position_initiale']:.1f}° -> {result['position_finale']:.1f}° "
-            f"(erreur: {result['erreur_finale']:.2f}°, "
-            f"AZCoupole: {result['position_cible']:.1f}°, "
-            f"{result['iterations']}/10 iter, {duration:.1f}s) "
-            f"[{self.failed_feedback_count}/{self.max_failed_feedback} échecs]"
+        self._log_feedback(
+            logging.WARNING, "Correction feedback imprécise", result, duration,
+            f" [{self.failed_feedback_count}/{self.max_failed_feedback} échecs]"
         )
 
     def _verifier_echecs_consecutifs(self) -> bool:
@@ -342,19 +365,25 @@ class TrackingCorrectionsMixin:
         return False
 
     def _log_detail_iterations(self, result: dict):
-        """Log le détail des itérations en mode debug."""
-        if result['iterations'] <= 1:
+        """
+        Log le détail des itérations en mode debug.
+
+        Un seul enregistrement multi-lignes (au lieu d'un par itération),
+        et rien n'est formaté si le niveau DEBUG est désactivé.
+        """
+        if result['iterations'] <= 1 or not self.logger.isEnabledFor(logging.DEBUG):
             return
 
-        self.logger.debug("  Détail corrections:")
+        lines = ["  Détail corrections:"]
         for corr in result['corrections']:
             correction = corr.get('correction_demandee', corr.get('correction_commandee', 0))
             erreur_avant = corr.get('erreur_avant', corr.get('erreur', 0))
             erreur_apres = corr.get('erreur_apres', 0)
-            self.logger.debug(
+            lines.append(
                 f"    Iter {corr['iteration']}: {correction:+.2f}° "
                 f"(erreur avant: {erreur_avant:+.2f}°, après: {erreur_apres:+.2f}°)"
             )
+        self.logger.debug("\n".join(lines))
 
     def _resync_encoder_offset(self, position_cible_logique: float):
         """
@@ -364,7 +393,6 @@ class TrackingCorrectionsMixin:
         n'a pas atteint exactement la cible. La re-sync corrige cela.
         """
         try:
-            from core.hardware.daemon_encoder_reader import get_daemon_reader
             real_position = get_daemon_reader().read_angle()
             old_offset = self.encoder_offset
             self.encoder_offset = position_cible_logique - real_position
@@ -386,34 +414,29 @@ class TrackingCorrectionsMixin:
             delta_deg: Correction en degrés (+ = horaire, - = anti-horaire)
             motor_delay: Délai entre les pas (secondes)
         """
-        # === CALCULER LE NOMBRE DE PAS AVEC FACTEUR DE CORRECTION ===
-        steps = int(
-            (abs(delta_deg) / 360.0) *
-            self.moteur.steps_per_dome_revolution)
+        # === CALCULER LE NOMBRE DE PAS ===
+        steps_per_degree = self._steps_per_degree
+        steps = int(abs(delta_deg) * steps_per_degree)
 
         if steps == 0:
             return
 
-        # Définir la direction
+        # Définir la direction (signe de delta_deg, non nul ici)
         direction = 1 if delta_deg > 0 else -1
         self.moteur.definir_direction(direction)
 
         # Log
-        self.logger.debug(
-            f"Déplacement (sans feedback): {steps} pas à {motor_delay}s/pas "
-            f"(facteur: {self.steps_correction_factor:.4f}, "
-            f"vitesse: {1 / motor_delay:.0f} pas/s)"
-            f"DEBUG: steps_per_dome_revolution = {self.moteur.steps_per_dome_revolution}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Déplacement (sans feedback): %d pas à %ss/pas "
+                "(facteur: %.4f, vitesse: %.0f pas/s, %.1f pas/°)",
+                steps, motor_delay, self.steps_correction_factor,
+                1 / motor_delay, steps_per_degree
+            )
 
-        # Appliquer la rotation
-        deg_per_step = 360.0 / self.moteur.steps_per_dome_revolution
-        angle = steps * deg_per_step * direction
+        # Appliquer la rotation (nombre entier de pas, reconverti en degrés)
+        angle = steps / steps_per_degree * direction
         self.moteur.rotation(angle, vitesse=motor_delay)
 
-        # Mettre à jour la position relative (normalisée dans [0, 360[)
-        self.position_relative = (self.position_relative + delta_deg) % 360
-
-        # Statistiques
-        self.total_corrections += 1
-        self.total_movement += abs(delta_deg)
+        # Position relative (normalisée dans [0, 360[) et statistiques
+        self._finaliser_correction(delta_deg, self.position_relative + delta_deg)
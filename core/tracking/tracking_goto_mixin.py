@@ -12,14 +12,30 @@ Date: Décembre 2025
 Version: 4.5
 """
 
+import time
 from datetime import datetime
-from typing import Tuple
+from typing import Any, Callable, Tuple
 
 from core.hardware.daemon_encoder_reader import get_daemon_reader
 from core.observatoire import PlanetaryEphemerides
 from core.observatoire.catalogue import GestionnaireCatalogue
 from core.utils.angle_utils import shortest_angular_distance
 
+# Catalogue partagé par les sessions du processus : le constructeur relit le
+# cache JSON et instancie Simbad. Le fichier cache est aussi écrit par
+# l'interface web, il est donc rechargé quand il change.
+_catalogue = None
+
+
+def _get_catalogue() -> GestionnaireCatalogue:
+    """Retourne le catalogue partagé, rechargé si le fichier cache a changé."""
+    global _catalogue
+    if _catalogue is None:
+        _catalogue = GestionnaireCatalogue()
+    else:
+        _catalogue.recharger_si_modifie()
+    return _catalogue
+
 
 class TrackingGotoMixin:
     """
@@ -29,6 +45,45 @@ class TrackingGotoMixin:
     du GOTO initial lors du démarrage du suivi.
     """
 
+    # Durée de validité d'une lecture démon (s) : les lectures enchaînées
+    # pendant start() (vérification GOTO puis sync encodeur) n'en font qu'une
+    DAEMON_CACHE_TTL_S = 0.05
+
+    def _cached_daemon_read(self, key: str, read: Callable[[], Any]) -> Any:
+        """
+        Lit le démon encodeur via un cache de DAEMON_CACHE_TTL_S.
+
+        Seules les lectures réussies sont mises en cache : une exception
+        de read() est propagée telle quelle. Le cache est vidé à chaque
+        commande moteur (voir _invalidate_daemon_cache).
+
+        Args:
+            key: Clé de cache ('status', 'angle')
+            read: Fonction de lecture du démon
+
+        Returns:
+            Valeur lue (ou mise en cache)
+        """
+        now = time.monotonic()
+        cached = self._daemon_cache.get(key)
+        if cached is not None and now - cached[0] < self.DAEMON_CACHE_TTL_S:
+            return cached[1]
+        value = read()
+        self._daemon_cache[key] = (now, value)
+        return value
+
+    def _invalidate_daemon_cache(self):
+        """Oublie les lectures démon : la coupole a été (ou est) en mouvement."""
+        self._daemon_cache.clear()
+
+    def _read_daemon_status(self):
+        """Statut du démon encodeur (lecture mise en cache, voir _cached_daemon_read)."""
+        return self._cached_daemon_read('status', get_daemon_reader().read_status)
+
+    def _read_daemon_angle(self) -> float:
+        """Angle du démon encodeur (lecture mise en cache, voir _cached_daemon_read)."""
+        return self._cached_daemon_read('angle', get_daemon_reader().read_angle)
+
     def _check_initial_goto(self, position_cible: float) -> Tuple[bool, float]:
         """
         Vérifie si un GOTO initial est nécessaire (encodeur calibré).
@@ -51,7 +106,7 @@ class TrackingGotoMixin:
             # Vérifier si le daemon est disponible et si l'encodeur est calibré
             # NOTE: On ne vérifie PAS encoder_available car le GOTO initial
             # est une fonctionnalité distincte du feedback boucle fermée
-            encoder_status = get_daemon_reader().read_status()
+            encoder_status = self._read_daemon_status()
             if not encoder_status:
                 self.logger.debug("Daemon encodeur non disponible")
                 return False, 0.0
@@ -65,7 +120,7 @@ class TrackingGotoMixin:
                 return False, 0.0
 
             # Lire la position réelle
-            real_position = get_daemon_reader().read_angle()
+            real_position = self._read_daemon_angle()
 
             # Calculer le delta via le chemin le plus court
             delta = shortest_angular_distance(real_position, position_cible)
@@ -102,25 +157,30 @@ class TrackingGotoMixin:
 
     def _rechercher_objet(self, objet_name: str) -> Tuple[bool, str]:
         """Recherche l'objet dans le catalogue."""
-        catalog = GestionnaireCatalogue()
-        result = catalog.rechercher(objet_name)
+        result = _get_catalogue().rechercher(objet_name)
 
         if not result or 'ra_deg' not in result or 'dec_deg' not in result:
             return False, f"Objet '{objet_name}' introuvable"
 
         self.objet = objet_name
+        self._objet_cap = objet_name.capitalize()
         self.ra_deg = result['ra_deg']
         self.dec_deg = result['dec_deg']
         self.is_planet = result.get('is_planet', False)
 
         return True, ""
 
+    def _get_ephemerides(self) -> PlanetaryEphemerides:
+        """Retourne l'instance d'éphémérides de la session (créée au premier appel)."""
+        if self._ephemerides is None:
+            self._ephemerides = PlanetaryEphemerides()
+        return self._ephemerides
+
     def _update_planet_coords(self, objet_name: str, now: datetime) -> Tuple[bool, str]:
         """Met à jour les coordonnées d'une planète."""
-        ephemerides = PlanetaryEphemerides()
-        planet_pos = ephemerides.get_planet_position(
-            objet_name.capitalize(), now,
-            self.calc.latitude, self.calc.longitude
+        planet_pos = self._get_ephemerides().get_planet_position(
+            self._objet_cap, now,
+            self._lat, self._lon
         )
         if planet_pos:
             self.ra_deg, self.dec_deg = planet_pos
@@ -132,7 +192,7 @@ class TrackingGotoMixin:
         """Configure la position initiale."""
         self.azimut_initial = azimut
         self.altitude_initiale = altitude
-        self.position_relative = position_cible
+        self._set_position_relative(position_cible)
 
     def _sync_encoder(self, position_cible: float):
         """Synchronise l'offset encodeur."""
@@ -140,7 +200,7 @@ class TrackingGotoMixin:
             return
 
         try:
-            encoder_status = get_daemon_reader().read_status()
+            encoder_status = self._read_daemon_status()
             if encoder_status:
                 is_calibrated = encoder_status.get('calibrated', False)
                 if is_calibrated:
@@ -151,7 +211,7 @@ class TrackingGotoMixin:
                         "Passez par le switch (45°) pour le mode absolu."
                     )
 
-            real_position = get_daemon_reader().read_angle()
+            real_position = self._read_daemon_angle()
             self.encoder_offset = position_cible - real_position
             self.logger.info(
                 f"SYNC: Coupole={position_cible:.1f}° | "
@@ -176,8 +236,8 @@ class TrackingGotoMixin:
             motor_delay: Délai entre les pas (secondes)
         """
         try:
-            # Lire la position actuelle de l'encodeur
-            position_actuelle = get_daemon_reader().read_angle()
+            # Lire la position actuelle de l'encodeur (coupole encore immobile)
+            position_actuelle = self._read_daemon_angle()
 
             self.logger.info(
                 f"GOTO initial: {position_actuelle:.1f}° → {position_cible:.1f}° "
@@ -231,3 +291,6 @@ class TrackingGotoMixin:
             self.logger.error(f"Erreur GOTO initial: {e}")
             # En cas d'erreur, position_relative reste à position_cible
             # ce qui est l'hypothèse de départ
+        finally:
+            # La coupole a pu bouger : les lectures démon d'avant le GOTO sont périmées
+            self._invalidate_daemon_cache()
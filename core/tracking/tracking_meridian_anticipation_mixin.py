@@ -211,7 +211,7 @@ class TrackingMeridianAnticipationMixin:
                 use_ramp=True,
                 force_direction=direction,
             )
-            self.position_relative = target % 360
+            self._set_position_relative(target)
             self.total_corrections += 1
             self.total_movement += abs(
                 shortest_angular_distance(previous_position, target)
@@ -11,9 +11,27 @@ Date: Décembre 2025
 Version: 4.5
 """
 
+import cmath
 import math
+import time
 from collections import deque
 from datetime import datetime
+from itertools import islice
+from typing import Optional
+
+from core.utils.angle_utils import normalize_angle_360
+
+# Conversions degrés <-> radians du lissage (évite math.radians/math.degrees)
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+
+def _dernieres_entrees(log, n: Optional[int]) -> list:
+    """Copie en liste des n dernières entrées d'un log (toutes si n est None)."""
+    if n is None or len(log) <= n:
+        return list(log)
+    # Parcours depuis la fin : O(n) et non O(len(log)) sur une deque
+    return list(islice(reversed(log), n))[::-1]
 
 
 class TrackingStateMixin:
@@ -24,6 +42,14 @@ class TrackingStateMixin:
     et de calcul des statistiques de session.
     """
 
+    # Taille max du journal des corrections (> une nuit complète de suivi) :
+    # au-delà, les plus anciennes entrées sont écartées (mémoire bornée)
+    MAX_CORRECTIONS_LOG = 10000
+    # Idem pour les échantillons de position (un toutes les 30 s : 24 h)
+    # et les mouvements GOTO (initial, transits méridien)
+    MAX_POSITION_LOG = 2880
+    MAX_GOTO_LOG = 1000
+
     def _init_tracking_state(self):
         """Initialise l'état du suivi."""
         # Position relative de la coupole
@@ -31,18 +57,21 @@ class TrackingStateMixin:
 
         # Données de l'objet suivi
         self.objet = None
+        self._objet_cap = None  # Nom capitalisé pour les éphémérides
         self.ra_deg = None
         self.dec_deg = None
         self.is_planet = False
+        # Éphémérides planétaires, créées une seule fois quand l'objet est une planète
+        self._ephemerides = None
 
         # Position initiale de référence
         self.azimut_initial = None
         self.altitude_initiale = None
-        self.angle_horaire_initial = None
 
         # État
         self.running = False
-        self.next_correction_time = None
+        self._next_correction_mono = 0.0  # Prochaine vérification (time.monotonic)
+        self._last_milestone_mono = None  # Dernier log session_health (time.monotonic)
 
         # Protection contre les oscillations
         self.correction_history = deque(maxlen=10)
@@ -53,15 +82,25 @@ class TrackingStateMixin:
         # Protection contre corrections feedback échouées
         self.failed_feedback_count = 0
         self.max_failed_feedback = 3
+        self._degraded_mode_notified = False  # Avertissement mode dégradé déjà émis
+
+        # Lectures démon encodeur récentes {clé: (time.monotonic, valeur)}
+        self._daemon_cache = {}
 
         # Indicateur de grand déplacement (basculement méridien ou GOTO)
         self.is_large_movement_in_progress = False
 
         # Lissage position cible (voir _smooth_position_cible pour algorithme détaillé)
         # - _cached_position_cible: dernière valeur lissée retournée
-        # - _position_cible_history: fenêtre glissante pour moyenne circulaire
+        # - _position_cible_history: fenêtre glissante des vecteurs unitaires e^{iθ}
+        # - _position_cible_sum: somme courante de la fenêtre (mise à jour en O(1))
+        # - _position_cible_last / _position_cible_repeats: dernière valeur brute
+        #   et nombre de répétitions consécutives en fin de fenêtre
         self._cached_position_cible = None
         self._position_cible_history = deque(maxlen=5)
+        self._position_cible_sum = 0j
+        self._position_cible_last = None
+        self._position_cible_repeats = 0
 
     def _init_statistics(self, motor_config):
         """Initialise les statistiques et paramètres de correction."""
@@ -71,24 +110,51 @@ class TrackingStateMixin:
         self.counterclockwise_movement = 0.0
         self.steps_correction_factor = motor_config.steps_correction_factor if motor_config else 1.0
 
-        # Timer pour le sampling des positions (graphiques)
+        # Timer pour le sampling des positions (graphiques, time.monotonic)
         self._last_position_log_time = None
         self._position_log_interval = 30  # secondes
 
         # Distribution du temps par mode (vitesse unique v5.10)
         self._mode_time_counters = {'continuous': 0}
         self._mode_time_last_mode = None
-        self._mode_time_last_time = None
+        self._mode_time_last_time = None  # time.monotonic
 
         self.drift_tracking = {
-            'start_time': datetime.now(),
-            'corrections_log': [],
-            'position_log': [],  # Sampling positions pour graphiques
-            'goto_log': [],      # Mouvements GOTO
+            'corrections_log': deque(maxlen=self.MAX_CORRECTIONS_LOG),
+            # Sampling positions pour graphiques
+            'position_log': deque(maxlen=self.MAX_POSITION_LOG),
+            'goto_log': deque(maxlen=self.MAX_GOTO_LOG),  # Mouvements GOTO
         }
+        self._set_start_time(datetime.now(), time.monotonic())
+        self._corrections_log_full_warned = False
 
         self.logger.info(f"Facteur de correction pas: {self.steps_correction_factor:.4f}")
 
+    def _set_position_relative(self, position: float):
+        """
+        Met à jour la position relative, normalisée dans [0, 360[.
+
+        Normaliser à l'écriture (corrections, GOTO, sync) évite un modulo
+        à chaque lecture du statut.
+        """
+        self.position_relative = normalize_angle_360(position)
+
+    def _set_start_time(self, start_time: datetime, start_mono: float):
+        """
+        Fixe l'heure de début de session et sa forme ISO (formatée une seule fois).
+
+        Les durées sont mesurées sur l'horloge monotone (voir _session_elapsed_s) :
+        l'heure murale ne sert qu'à l'affichage. start_mono doit être lu au même
+        instant que start_time.
+        """
+        self.drift_tracking['start_time'] = start_time
+        self._start_time_iso = start_time.isoformat()
+        self._start_mono = start_mono
+
+    def _session_elapsed_s(self) -> float:
+        """Durée écoulée depuis le début de session (secondes, time.monotonic)."""
+        return time.monotonic() - self._start_mono
+
     def _smooth_position_cible(self, new_position: float) -> float:
         """
         Lisse la position cible pour éviter les oscillations visuelles dans l'UI.
@@ -105,10 +171,12 @@ class TrackingStateMixin:
             Moyenne glissante sur les 5 dernières valeurs avec:
             1. Gestion de la circularité (359° → 1° = +2°, pas -358°)
             2. Reset automatique si saut > 10° (changement réel, pas du bruit)
-            3. Moyenne circulaire via atan2(Σsin, Σcos)
+            3. Moyenne circulaire via atan2(Σsin, Σcos), somme tenue à jour
+               incrémentalement (O(1) par appel)
 
         Fonctionnement:
             1. Normaliser l'angle dans [0, 360[
+               (fenêtre déjà remplie de cette valeur → retourner le cache)
             2. Si première valeur → initialiser et retourner
             3. Calculer delta circulaire avec la valeur cachée
             4. Si |delta| > 10° → reset historique (mouvement réel)
@@ -118,6 +186,9 @@ class TrackingStateMixin:
             - Convertir chaque angle θ en vecteur unitaire (cos θ, sin θ)
             - Sommer les composantes: (Σcos θ, Σsin θ)
             - L'angle moyen = atan2(Σsin, Σcos)
+            Les vecteurs sont stockés sous forme complexe e^{iθ} : la somme
+            est mise à jour en retirant le vecteur sortant de la fenêtre et
+            en ajoutant le nouveau, sans re-sommer tout l'historique.
             Cette méthode évite le problème de la moyenne arithmétique
             qui donnerait 180° pour [1°, 359°] au lieu de 0°.
 
@@ -138,41 +209,53 @@ class TrackingStateMixin:
             >>> _smooth_position_cible(180.0)  # → 180.0° (reset, pas de lissage)
         """
         new_position = new_position % 360
+        history = self._position_cible_history
+
+        # Fenêtre entièrement remplie de cette même valeur : ajouter un
+        # vecteur identique ne change ni la fenêtre ni la moyenne
+        if new_position == self._position_cible_last:
+            if self._position_cible_repeats >= history.maxlen:
+                return self._cached_position_cible
+            self._position_cible_repeats += 1
+        else:
+            self._position_cible_last = new_position
+            self._position_cible_repeats = 1
+
+        vecteur = cmath.rect(1.0, new_position * _DEG2RAD)
 
         # Si c'est la première valeur, initialiser le cache
         if self._cached_position_cible is None:
             self._cached_position_cible = new_position
-            self._position_cible_history.append(new_position)
+            history.append(vecteur)
+            self._position_cible_sum = vecteur
             return new_position
 
-        # Calculer le delta avec gestion de la circularité
-        delta = new_position - self._cached_position_cible
-        if delta > 180:
-            delta -= 360
-        elif delta < -180:
-            delta += 360
+        # Calculer le delta avec gestion de la circularité (sans branchement)
+        delta = (new_position - self._cached_position_cible + 180.0) % 360.0 - 180.0
 
         # Si le saut est très grand (>10°), c'est un vrai changement, pas du bruit
         # → réinitialiser l'historique
         if abs(delta) > 10:
-            self._position_cible_history.clear()
-            self._position_cible_history.append(new_position)
+            history.clear()
+            history.append(vecteur)
+            self._position_cible_sum = vecteur
             self._cached_position_cible = new_position
             return new_position
 
-        # Ajouter à l'historique
-        self._position_cible_history.append(new_position)
+        # Ajouter à l'historique (le plus ancien sort de la somme si fenêtre pleine)
+        if len(history) == history.maxlen:
+            self._position_cible_sum -= history[0]
+        history.append(vecteur)
+        self._position_cible_sum += vecteur
 
         # Calculer la moyenne circulaire
-        if len(self._position_cible_history) < 2:
+        if len(history) < 2:
             self._cached_position_cible = new_position
             return new_position
 
-        # Moyenne circulaire en utilisant le sinus/cosinus
-        sin_sum = sum(math.sin(math.radians(p)) for p in self._position_cible_history)
-        cos_sum = sum(math.cos(math.radians(p)) for p in self._position_cible_history)
-        mean_rad = math.atan2(sin_sum, cos_sum)
-        mean_deg = math.degrees(mean_rad) % 360
+        # Moyenne circulaire : argument de la somme des vecteurs unitaires
+        sum_vec = self._position_cible_sum
+        mean_deg = (math.atan2(sum_vec.imag, sum_vec.real) * _RAD2DEG) % 360
 
         self._cached_position_cible = mean_deg
         return mean_deg
@@ -181,6 +264,23 @@ class TrackingStateMixin:
     # SESSION DATA LOGGING
     # =========================================================================
 
+    def _log_correction(self, entry: dict):
+        """
+        Ajoute une correction au journal de session (borné à MAX_CORRECTIONS_LOG).
+
+        Quand le journal est plein, l'entrée la plus ancienne est écartée ;
+        un avertissement unique le signale (rapport de session incomplet).
+        """
+        log = self.drift_tracking['corrections_log']
+        if len(log) == log.maxlen and not self._corrections_log_full_warned:
+            self._corrections_log_full_warned = True
+            self.logger.warning(
+                "Journal des corrections plein (%d entrées) : "
+                "les plus anciennes ne figureront pas dans le rapport de session",
+                log.maxlen
+            )
+        log.append(entry)
+
     def _log_position_sample(self, azimut: float, altitude: float,
                              dome_position: float, mode: str):
         """
@@ -188,18 +288,18 @@ class TrackingStateMixin:
 
         Appelé périodiquement (toutes les 30s) pendant le tracking.
         """
-        now = datetime.now()
+        now_mono = time.monotonic()
 
         # Vérifier si assez de temps s'est écoulé depuis le dernier log
+        # (horloge monotone : insensible aux sauts d'heure système)
         if self._last_position_log_time is not None:
-            elapsed = (now - self._last_position_log_time).total_seconds()
-            if elapsed < self._position_log_interval:
+            if now_mono - self._last_position_log_time < self._position_log_interval:
                 return
 
-        self._last_position_log_time = now
+        self._last_position_log_time = now_mono
 
         self.drift_tracking['position_log'].append({
-            'timestamp': now.isoformat(),
+            'timestamp': datetime.now().isoformat(),
             'azimut': round(azimut, 2),
             'altitude': round(altitude, 2),
             'dome_position': round(dome_position, 2),
@@ -231,7 +331,7 @@ class TrackingStateMixin:
 
         Conservé pour compat historique : un seul compteur `continuous`.
         """
-        now = datetime.now()
+        now = time.monotonic()
         mode_key = 'continuous'
 
         if self._mode_time_last_time is None:
@@ -239,8 +339,7 @@ class TrackingStateMixin:
             self._mode_time_last_time = now
             return
 
-        elapsed = (now - self._mode_time_last_time).total_seconds()
-        self._mode_time_counters[mode_key] += elapsed
+        self._mode_time_counters[mode_key] += now - self._mode_time_last_time
         self._mode_time_last_time = now
 
     def _track_correction_direction(self, correction_deg: float):
@@ -255,22 +354,25 @@ class TrackingStateMixin:
         else:
             self.counterclockwise_movement += abs(correction_deg)
 
-    def get_session_data(self) -> dict:
+    def get_session_data(self, max_log_entries: Optional[int] = None) -> dict:
         """
         Retourne les données de session pour l'API.
 
+        Args:
+            max_log_entries: Si fourni, ne renvoie que les N dernières entrées
+                de chaque log (statut périodique). None = logs complets
+                (sauvegarde de fin de session).
+
         Returns:
             dict avec toutes les données de session pour affichage/sauvegarde
         """
-        now = datetime.now()
-        start_time = self.drift_tracking.get('start_time', now)
-        duration_seconds = (now - start_time).total_seconds()
+        duration_seconds = self._session_elapsed_s()
 
         # Finaliser le temps du mode courant (vitesse unique v5.10)
         self._update_mode_time('continuous')
 
         return {
-            'start_time': start_time.isoformat(),
+            'start_time': self._start_time_iso,
             'duration_seconds': int(duration_seconds),
             'summary': {
                 'total_corrections': self.total_corrections,
@@ -284,9 +386,15 @@ class TrackingStateMixin:
                     'continuous': int(self._mode_time_counters.get('continuous', 0)),
                 }
             },
-            'corrections_log': self.drift_tracking.get('corrections_log', []),
-            'position_log': self.drift_tracking.get('position_log', []),
-            'goto_log': self.drift_tracking.get('goto_log', []),
+            'corrections_log': _dernieres_entrees(
+                self.drift_tracking.get('corrections_log', ()), max_log_entries
+            ),
+            'position_log': _dernieres_entrees(
+                self.drift_tracking.get('position_log', ()), max_log_entries
+            ),
+            'goto_log': _dernieres_entrees(
+                self.drift_tracking.get('goto_log', ()), max_log_entries
+            ),
         }
 
     # =========================================================================
@@ -298,25 +406,25 @@ class TrackingStateMixin:
         if not self.drift_tracking.get('start_time'):
             return
 
-        duration = datetime.now() - self.drift_tracking['start_time']
-        duration_hours = duration.total_seconds() / 3600
+        duration_s = self._session_elapsed_s()
+        duration_hours = duration_s / 3600
 
         self.logger.info("=" * 60)
         self.logger.info("BILAN DE LA SESSION")
         self.logger.info("=" * 60)
 
-        self._log_basic_stats(duration_hours, duration)
+        self._log_basic_stats(duration_hours, duration_s)
         self._log_rate_stats(duration_hours)
         self._log_additional_info()
 
         self.logger.info("=" * 60)
 
-    def _log_basic_stats(self, duration_hours: float, duration):
+    def _log_basic_stats(self, duration_hours: float, duration_s: float):
         """Log les statistiques de base."""
         self.logger.info(f"Objet: {self.objet}")
         self.logger.info("Méthode: ABAQUE")
         self.logger.info(
-            f"Durée: {duration_hours:.2f}h ({duration.total_seconds() / 60:.1f}min)"
+            f"Durée: {duration_hours:.2f}h ({duration_s / 60:.1f}min)"
         )
         self.logger.info(f"Corrections appliquées: {self.total_corrections}")
         self.logger.info(f"Mouvement total: {self.total_movement:.1f}°")
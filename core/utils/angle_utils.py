@@ -65,12 +65,15 @@ def shortest_angular_distance(current: float, target: float) -> float:
     - Positif : sens horaire
     - Négatif : sens anti-horaire
 
+    Forme sans branchement : 180 - (180 - Δ) mod 360 donne directement
+    l'intervalle ]-180, 180] (un demi-tour exact reste +180, sens horaire).
+
     Args:
         current: Angle actuel en degrés
         target: Angle cible en degrés
 
     Returns:
-        Delta angulaire (entre -180 et +180)
+        Delta angulaire (entre -180 exclu et +180 inclus)
 
     Examples:
         >>> shortest_angular_distance(350, 10)
@@ -80,11 +83,7 @@ def shortest_angular_distance(current: float, target: float) -> float:
         >>> shortest_angular_distance(0, 180)
         180.0
     """
-    delta = (target - current) % 360
-    if delta > 180:
-        delta -= 360
-
-    return delta
+    return 180.0 - (180.0 - (target - current)) % 360.0
 
 
 def angles_are_close(angle1: float, angle2: float, tolerance: float = 0.5) -> bool:
@@ -638,7 +638,7 @@ class TrackingHandler:
                     )
                     tracking_info["meridian_seconds"] = round(-ha * 239.3447)
                     passage = self._calc.calculer_heure_passage_meridien(
-                        ra_deg, now, declinaison=dec_deg
+                        ra_deg, now, declinaison=dec_deg, angle_horaire=ha
                     )
                     tracking_info["meridian_time"] = passage.strftime('%Hh%M')
 
@@ -646,11 +646,9 @@ class TrackingHandler:
 
                 # Données de session pour l'API /api/session/
                 # Tronquer les logs pour éviter la fuite mémoire sur sessions longues
-                session_data = self.session.get_session_data()
-                limit = self.MAX_SESSION_LOG_ENTRIES
-                for key in ("corrections_log", "position_log", "goto_log"):
-                    if key in session_data and len(session_data[key]) > limit:
-                        session_data[key] = session_data[key][-limit:]
+                session_data = self.session.get_session_data(
+                    max_log_entries=self.MAX_SESSION_LOG_ENTRIES
+                )
                 current_status["session_data"] = session_data
             else:
                 self.active = False
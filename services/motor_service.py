@@ -19,13 +19,16 @@ Version: 4.4 - Refactoring en modules
 """
 
 from collections import deque
+import atexit
 import logging
 import os
+import queue
 import signal
 import sys
 import threading
 import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -100,11 +103,47 @@ _current_file_handler.setFormatter(
     logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(), _current_file_handler],
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+
+# Les loggers n'écrivent pas directement : ils empilent les enregistrements
+# dans une file, vidée par un thread dédié (QueueListener) qui fait les
+# écritures console/fichier. La boucle de suivi ne bloque jamais sur l'I/O.
+_log_queue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+# Message seul : l'horodatage et le niveau sont ajoutés par les handlers finaux
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(
+    _log_queue, _stream_handler, _current_file_handler, respect_handler_level=True
 )
+
+# Vrai entre _start_log_listener() et _stop_log_listener()
+_log_listener_running = False
+
+
+def _start_log_listener() -> None:
+    """Démarre le listener de logs (sans effet s'il tourne déjà)."""
+    global _log_listener_running
+    if not _log_listener_running:
+        _log_listener.start()
+        _log_listener_running = True
+
+
+def _stop_log_listener() -> None:
+    """Arrête le listener de logs après avoir vidé la file (sans effet s'il est arrêté)."""
+    global _log_listener_running
+    if _log_listener_running:
+        try:
+            _log_listener.stop()
+        finally:
+            _log_listener_running = False
+
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_start_log_listener()
+atexit.register(_stop_log_listener)
 logger = logging.getLogger(__name__)
 
 
@@ -135,22 +174,27 @@ def rotate_log_for_tracking(object_name: str) -> str:
     new_log_filename = f"motor_service_{timestamp}_{safe_name}.log"
     new_log_path = LOGS_DIR / new_log_filename
 
-    # Récupérer le root logger
-    root_logger = logging.getLogger()
+    # Créer le nouveau handler AVANT de toucher au listener : en cas d'échec
+    # (permissions, disque plein), les logs continuent vers l'ancien fichier
+    new_file_handler = logging.FileHandler(new_log_path, mode="w")
+    new_file_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    new_file_handler.setLevel(logging.INFO)
 
-    # Fermer et retirer l'ancien handler de fichier
+    # Vider la file dans l'ancien fichier puis le fermer : l'arrêt du
+    # listener traite tous les enregistrements déjà en attente
     if _current_file_handler:
         logger.info(f"=== Rotation log vers: {new_log_filename} ===")
-        _current_file_handler.close()
-        root_logger.removeHandler(_current_file_handler)
-
-    # Créer le nouveau handler
-    _current_file_handler = logging.FileHandler(new_log_path, mode="w")
-    _current_file_handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    )
-    _current_file_handler.setLevel(logging.INFO)
-    root_logger.addHandler(_current_file_handler)
+    _stop_log_listener()
+    try:
+        if _current_file_handler:
+            _current_file_handler.close()
+    finally:
+        # Le listener redémarre toujours, sinon la file grossit sans fin
+        _current_file_handler = new_file_handler
+        _log_listener.handlers = (_stream_handler, _current_file_handler)
+        _start_log_listener()
 
     # Premier message dans le nouveau fichier
     logger.info("=" * 60)
@@ -779,8 +823,9 @@ def main():
     logs_dir = Path(__file__).parent.parent / "logs"
     logs_dir.mkdir(exist_ok=True)
 
-    # Détection automatique du matériel
-    is_production, _ = HardwareDetector.detect_hardware()
+    # Le mode production équivaut à la détection du Raspberry Pi : le probe
+    # complet (GPIO, SPI, démon encodeur) est fait une seule fois par MotorService
+    is_production = HardwareDetector.is_raspberry_pi()
 
     # En production, vérifier les permissions
     if is_production and os.geteuid() != 0:
@@ -14,6 +14,7 @@ Version: 4.6 - Délais réalistes pour simulation fidèle
 import logging
 import time
 
+from core.hardware.moteur_simule import get_simulated_position
 
 logger = logging.getLogger(__name__)
 
@@ -41,8 +42,6 @@ class SimulatedDaemonReader:
 
     def read_raw(self) -> dict:
         """Retourne un statut simulé (pas de délai — utilisé pour le statut, pas la position)."""
-        from core.hardware.moteur_simule import get_simulated_position
-
         return {
             "angle": get_simulated_position(),
             "calibrated": True,
@@ -57,8 +56,6 @@ class SimulatedDaemonReader:
         Args:
             timeout_ms: Timeout en ms (respecté : le délai simulé est toujours < timeout)
         """
-        from core.hardware.moteur_simule import get_simulated_position
-
         # Simuler la latence I2C réelle (~1ms), sans dépasser le timeout
         delay = min(_I2C_LATENCY_S, timeout_ms / 1000.0)
         time.sleep(delay)
@@ -349,6 +349,46 @@ class TestAbaqueManagerInterpolation:
         # Devrait être proche de 0° (milieu de 355-5 et 356-6)
         assert result < 10 or result > 350
 
+    def test_grille_precalculee(self, manager_with_data):
+        """La grille 2-D reprend les valeurs mesurées, indexée (altitude, azimut)."""
+        manager_with_data._build_value_grid()
+
+        grille = manager_with_data._grid_rows
+        assert (len(grille), len(grille[0])) == (4, 8)
+        assert grille[0][1] == 47
+        assert grille[1][2] == 96
+
+    def test_axes_python_identiques_aux_grilles(self, manager_with_data):
+        """Les axes en listes Python reprennent exactement les grilles NumPy."""
+        manager_with_data._build_value_grid()
+
+        assert manager_with_data._alt_axis == manager_with_data._alt_grid.tolist()
+        assert manager_with_data._az_axis == manager_with_data._az_grid.tolist()
+
+    def test_interpolation_sur_noeud_retourne_valeur_mesuree(self, manager_with_data):
+        """Sur un nœud de grille, l'interpolation rend la mesure (bornes bisect)."""
+        assert manager_with_data._interpolate_circular(45.0, 90.0) == pytest.approx(96)
+
+    def test_point_manquant_bascule_plus_proche_voisin(self, sample_abaque_data):
+        """Un point absent de la grille déclenche le repli plus proche voisin."""
+        from core.tracking.abaque_manager import AbaqueManager
+
+        data = {alt: {k: list(v) for k, v in d.items()} for alt, d in sample_abaque_data.items()}
+        del data[45.0]['az_astre'][1]
+        del data[45.0]['az_coupole'][1]
+
+        manager = AbaqueManager()
+        manager.data_by_altitude = data
+        manager.is_loaded = True
+        manager._compute_statistics()
+        manager._create_interpolator()
+
+        with pytest.raises(ValueError):
+            manager._interpolate_circular(37.5, 30.0)
+
+        _, infos = manager.get_dome_position(37.5, 30.0)
+        assert infos["method"] == "nearest_neighbor"
+
 
 class TestAbaqueManagerComputeStatistics:
     """Tests pour le calcul des statistiques."""
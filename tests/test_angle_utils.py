@@ -117,6 +117,20 @@ class TestShortestAngularDistance:
         result = shortest_angular_distance(359.999, 0.001)
         assert result == pytest.approx(0.002, abs=0.001)
 
+    def test_demi_tour_toujours_positif(self):
+        """Un demi-tour exact donne +180 quel que soit le sens de l'écart."""
+        assert shortest_angular_distance(180.0, 0.0) == 180.0
+        assert shortest_angular_distance(10.0, 190.0) == 180.0
+        assert shortest_angular_distance(190.0, 10.0) == 180.0
+        assert shortest_angular_distance(0.0, -180.0) == 180.0
+
+    def test_bornes_intervalle(self):
+        """Le résultat reste dans ]-180, 180] de part et d'autre du demi-tour."""
+        assert shortest_angular_distance(0.0, 180.5) == pytest.approx(-179.5)
+        assert shortest_angular_distance(0.0, 179.5) == pytest.approx(179.5)
+        assert shortest_angular_distance(0.0, 540.0) == 180.0
+        assert shortest_angular_distance(720.0, -0.5) == pytest.approx(-0.5)
+
 
 class TestAnglesAreClose:
     """Tests pour angles_are_close."""
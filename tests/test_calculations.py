@@ -51,6 +51,14 @@ class TestAstronomicalCalculationsInit:
         assert calc.longitude == 2.35
         assert calc.tz_offset == 2
 
+    def test_init_trigo_latitude_precalculee(self):
+        """sin/cos de la latitude sont calculés une fois à l'initialisation."""
+        from core.observatoire.calculations import AstronomicalCalculations
+
+        calc = AstronomicalCalculations(latitude=44.15, longitude=5.23, tz_offset=1)
+        assert calc._sin_lat == pytest.approx(math.sin(math.radians(44.15)))
+        assert calc._cos_lat == pytest.approx(math.cos(math.radians(44.15)))
+
 
 class TestNormalisationAngles:
     """Tests pour les méthodes de normalisation."""
@@ -235,6 +243,19 @@ class TestCoordonneesHorizontales:
         assert isinstance(correction, float)
         assert 0 <= az_coupole < 360
 
+    def test_coords_horizontales_batch_identiques(self, calc):
+        """La version vectorisée donne les mêmes coordonnées que l'appel unitaire."""
+        debut = datetime(2025, 6, 21, 22, 0, 0)
+        dates = [debut + timedelta(minutes=10 * i) for i in range(12)]
+
+        az_arr, alt_arr = calc.calculer_coords_horizontales_batch(250.0, 36.0, dates)
+
+        assert len(az_arr) == len(dates)
+        for date, az_b, alt_b in zip(dates, az_arr, alt_arr):
+            az, alt = calc.calculer_coords_horizontales(250.0, 36.0, date)
+            assert az_b == pytest.approx(az, abs=1e-9)
+            assert alt_b == pytest.approx(alt, abs=1e-9)
+
 
 class TestRefractionAtmospherique:
     """Tests pour la correction de réfraction."""
@@ -300,6 +321,18 @@ class TestPassageMeridien:
         assert isinstance(passage, datetime)
         assert passage.date() == date.date()
 
+    def test_heure_passage_meridien_angle_horaire_fourni(self, calc):
+        """Un angle horaire déjà calculé donne la même heure de passage."""
+        date = datetime(2025, 6, 21, 12, 0, 0)
+        ha = calc.calculer_angle_horaire(250.0, date, deja_jnow=False, declinaison=36.0)
+
+        attendu = calc.calculer_heure_passage_meridien(250.0, date, declinaison=36.0)
+        passage = calc.calculer_heure_passage_meridien(
+            250.0, date, declinaison=36.0, angle_horaire=ha
+        )
+
+        assert passage == attendu
+
 
 class TestVitesseRotationCoupole:
     """Tests pour le calcul de vitesse de rotation."""
@@ -10,6 +10,7 @@ Couvre :
 """
 
 import json
+import os
 
 import pytest
 
@@ -147,6 +148,42 @@ class TestRechercher:
             assert "dec_deg" in result
 
 
+# =============================================================================
+# Rechargement du cache
+# =============================================================================
+
+class TestRechargerSiModifie:
+    def test_inchange_pas_de_rechargement(self, populated_catalogue):
+        """Fichier non modifié : rien n'est relu."""
+        assert populated_catalogue.recharger_si_modifie() is False
+        assert "M42" in populated_catalogue.objets
+
+    def test_fichier_modifie_recharge(self, populated_catalogue):
+        """Fichier réécrit par un autre processus : le nouveau contenu est chargé."""
+        cache_file = populated_catalogue.cache_file
+        cache_file.write_text(json.dumps({"M31": {"nom": "M 31"}}))
+        stat = cache_file.stat()
+        os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert populated_catalogue.recharger_si_modifie() is True
+        assert list(populated_catalogue.objets) == ["M31"]
+
+    def test_fichier_supprime_vide_le_catalogue(self, populated_catalogue):
+        """Fichier supprimé : le catalogue local est vidé."""
+        populated_catalogue.cache_file.unlink()
+
+        assert populated_catalogue.recharger_si_modifie() is True
+        assert populated_catalogue.objets == {}
+        assert populated_catalogue.recharger_si_modifie() is False
+
+    def test_propre_sauvegarde_pas_de_rechargement(self, empty_catalogue):
+        """Une sauvegarde du catalogue lui-même ne déclenche pas de relecture."""
+        empty_catalogue.objets["TEST"] = {"nom": "Test"}
+        empty_catalogue._sauvegarder_cache()
+
+        assert empty_catalogue.recharger_si_modifie() is False
+
+
 # =============================================================================
 # Sauvegarde cache
 # =============================================================================
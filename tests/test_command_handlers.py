@@ -421,6 +421,24 @@ class TestTrackingHandler:
         assert isinstance(tracking_info["meridian_seconds"], int)
         assert "h" in tracking_info["meridian_time"]
 
+    def test_update_session_data_tronquees(self, handler):
+        """update() demande à la session des logs limités à MAX_SESSION_LOG_ENTRIES."""
+        handler.active = True
+        handler.session = MagicMock()
+        handler.session.check_and_correct.return_value = (False, "")
+        handler.session.ra_deg = None
+        handler.session.get_status.return_value = {"running": True}
+        handler.session.get_session_data.return_value = {"corrections_log": []}
+        handler._calc = MagicMock()
+
+        current_status = {"status": "tracking"}
+        handler.update(current_status)
+
+        handler.session.get_session_data.assert_called_once_with(
+            max_log_entries=handler.MAX_SESSION_LOG_ENTRIES
+        )
+        assert current_status["session_data"] == {"corrections_log": []}
+
     def test_update_without_ra_deg_no_meridian(self, handler):
         """update() sans ra_deg n'inclut pas de données méridien."""
         handler.active = True
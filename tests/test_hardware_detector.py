@@ -71,6 +71,11 @@ class TestDetectHardware:
         # (sauf si ARM Linux, cf. finding M-09)
         assert isinstance(is_prod, bool)
 
+    def test_production_equivaut_a_raspberry_pi(self):
+        """Le mode production suit is_raspberry_pi() (utilisé seul par main())."""
+        is_prod, hw_info = HardwareDetector.detect_hardware()
+        assert is_prod == hw_info["raspberry_pi"] == HardwareDetector.is_raspberry_pi()
+
 
 class TestGetHardwareSummary:
     def test_generates_string(self):
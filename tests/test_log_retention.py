@@ -11,6 +11,8 @@ import os
 import time
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 
 # =========================================================================
 # Tests rétention temporelle motor_service logs
@@ -93,6 +95,83 @@ class TestMotorServiceLogRetention:
         assert len(remaining) == 5
 
 
+class TestMotorServiceLogQueue:
+    """Tests pour l'écriture des logs via QueueHandler/QueueListener."""
+
+    def test_rotation_bascule_le_listener(self, tmp_path):
+        """Après rotation, le listener écrit dans le nouveau fichier de session."""
+        import logging
+        import services.motor_service as ms
+
+        anciens_handlers = ms._log_listener.handlers
+        try:
+            with (
+                patch.object(ms, "LOGS_DIR", tmp_path),
+                patch.object(ms, "_current_file_handler", None),
+            ):
+                new_path = ms.rotate_log_for_tracking("M 31")
+                nouveau_handler = ms._current_file_handler
+
+                record = logging.LogRecord(
+                    "test", logging.INFO, __file__, 0, "apres %s", ("rotation",), None
+                )
+                ms._queue_handler.handle(record)
+                ms._stop_log_listener()  # vide la file
+                ms._start_log_listener()
+
+            assert nouveau_handler in ms._log_listener.handlers
+            assert "apres rotation" in open(new_path, encoding="utf-8").read()
+        finally:
+            ms._stop_log_listener()
+            ms._log_listener.handlers = anciens_handlers
+            ms._start_log_listener()
+            nouveau_handler.close()
+
+    def test_echec_creation_fichier_listener_actif(self, tmp_path):
+        """Si le nouveau fichier ne peut être créé, l'ancien handler reste actif."""
+        import services.motor_service as ms
+
+        handler_avant = ms._current_file_handler
+        with patch.object(ms, "LOGS_DIR", tmp_path / "absent"):
+            with pytest.raises(OSError):
+                ms.rotate_log_for_tracking("M 31")
+
+        assert ms._current_file_handler is handler_avant
+        assert ms._log_listener_running is True
+
+    def test_arret_listener_idempotent(self):
+        """Le stop enregistré via atexit peut être appelé deux fois."""
+        import services.motor_service as ms
+
+        try:
+            ms._stop_log_listener()
+            ms._stop_log_listener()
+            assert ms._log_listener_running is False
+        finally:
+            ms._start_log_listener()
+
+    def test_rotation_apres_arret_listener(self, tmp_path):
+        """Une rotation avec le listener déjà arrêté le redémarre sans erreur."""
+        import services.motor_service as ms
+
+        anciens_handlers = ms._log_listener.handlers
+        try:
+            ms._stop_log_listener()
+            with (
+                patch.object(ms, "LOGS_DIR", tmp_path),
+                patch.object(ms, "_current_file_handler", None),
+            ):
+                ms.rotate_log_for_tracking("M 31")
+                nouveau_handler = ms._current_file_handler
+
+            assert ms._log_listener_running is True
+        finally:
+            ms._stop_log_listener()
+            ms._log_listener.handlers = anciens_handlers
+            ms._start_log_listener()
+            nouveau_handler.close()
+
+
 # =========================================================================
 # Tests rétention temporelle session_storage
 # =========================================================================
@@ -199,6 +278,40 @@ class TestRobustSessionSave:
         session.logger.warning.assert_called_once()
         assert "data error" in str(session.logger.warning.call_args)
 
+    def test_save_session_module_indisponible_memorise(self, monkeypatch):
+        """Sans web.session, la sauvegarde est ignorée sans retenter l'import."""
+        import core.tracking.tracker as tracker_module
+        from core.tracking.tracker import TrackingSession
+
+        monkeypatch.setattr(tracker_module, "_session_storage", None)
+        monkeypatch.setattr(tracker_module, "_session_storage_unavailable", True)
+
+        session = MagicMock(spec=TrackingSession)
+        session.logger = MagicMock()
+
+        TrackingSession._save_session_to_file(session)
+
+        session.get_session_data.assert_not_called()
+        session.logger.warning.assert_not_called()
+
+    def test_save_session_erreur_import_loggee(self, monkeypatch):
+        """Une erreur autre qu'ImportError à l'import de web.session est loggée."""
+        import core.tracking.tracker as tracker_module
+        from core.tracking.tracker import TrackingSession
+
+        monkeypatch.setattr(
+            tracker_module, "_get_session_storage",
+            MagicMock(side_effect=RuntimeError("django mal configuré")),
+        )
+
+        session = MagicMock(spec=TrackingSession)
+        session.logger = MagicMock()
+
+        TrackingSession._save_session_to_file(session)
+
+        session.logger.warning.assert_called_once()
+        assert "django mal configuré" in str(session.logger.warning.call_args)
+
     def test_tracking_handler_stop_fallback_save(self):
         """TrackingHandler.stop() tente la sauvegarde même si session.stop() échoue."""
         from services.command_handlers import TrackingHandler
@@ -9,7 +9,6 @@ Note: Ces tests nécessitent astropy (via core.tracking.tracker).
 
 import logging
 import time
-from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -157,28 +156,28 @@ class TestSessionMilestone:
         tracking_session.total_corrections = 15
         tracking_session.total_movement = 8.5
         tracking_session.failed_feedback_count = 0
-        tracking_session.drift_tracking['start_time'] = datetime.now() - timedelta(minutes=6)
-        tracking_session._last_milestone_time = datetime.now() - timedelta(minutes=6)
+        tracking_session._start_mono = time.monotonic() - 6 * 60
+        tracking_session._last_milestone_mono = time.monotonic() - 6 * 60
 
         with caplog.at_level(logging.INFO, logger='core.tracking.tracker'):
-            tracking_session._check_session_milestone()
+            tracking_session._check_session_milestone(time.monotonic())
 
         health_logs = [r for r in caplog.records if "session_health |" in r.message]
         assert len(health_logs) >= 1, f"Pas de session_health. Logs: {[r.message for r in caplog.records]}"
 
         msg = health_logs[0].message
         assert "object=NGC_5033" in msg
-        assert "duration_min=" in msg
+        assert "duration_min=6" in msg
         assert "corrections=15" in msg
         assert "encoder=" in msg
 
     def test_no_milestone_before_5min(self, tracking_session, caplog):
         """Pas de session_health avant 5 minutes."""
         tracking_session.running = True
-        tracking_session._last_milestone_time = datetime.now() - timedelta(minutes=2)
+        tracking_session._last_milestone_mono = time.monotonic() - 2 * 60
 
         with caplog.at_level(logging.INFO, logger='core.tracking.tracker'):
-            tracking_session._check_session_milestone()
+            tracking_session._check_session_milestone(time.monotonic())
 
         health_logs = [r for r in caplog.records if "session_health |" in r.message]
         assert len(health_logs) == 0
@@ -194,7 +193,7 @@ class TestStructuredFormat:
         """Les corrections utilisent le format structuré."""
         tracking_session.running = True
         tracking_session.position_relative = 100.0
-        tracking_session.next_correction_time = None
+        tracking_session._next_correction_mono = 0.0
 
         tracking_session._calculate_current_coords = MagicMock(return_value=(180.0, 45.0))
         tracking_session._calculate_target_position = MagicMock(return_value=(102.0, {}))
@@ -219,7 +218,7 @@ class TestStructuredFormat:
         """Le transit méridien utilise le format structuré."""
         tracking_session.running = True
         tracking_session.position_relative = 246.0
-        tracking_session.next_correction_time = None
+        tracking_session._next_correction_mono = 0.0
 
         tracking_session._calculate_current_coords = MagicMock(return_value=(180.0, 45.0))
         tracking_session._calculate_target_position = MagicMock(return_value=(112.0, {}))
@@ -283,6 +283,33 @@ class TestPositionNormalization:
         assert abs(tracking_session.position_relative - 355.0) < 0.01, \
             f"Attendu 355.0°, obtenu {tracking_session.position_relative}°"
 
+    def test_sans_feedback_pas_entiers(self, tracking_session):
+        """La rotation commandée correspond à un nombre entier de pas moteur."""
+        tracking_session.encoder_available = False
+        steps_per_degree = tracking_session._steps_per_degree
+
+        with patch.object(tracking_session.moteur, 'rotation') as mock_rotation:
+            tracking_session._apply_correction_sans_feedback(1.0, 0.002)
+
+        angle = mock_rotation.call_args[0][0]
+        assert steps_per_degree == tracking_session.moteur.steps_per_dome_revolution / 360.0
+        assert angle * steps_per_degree == pytest.approx(int(steps_per_degree))
+        assert angle <= 1.0
+
+    def test_sans_feedback_direction_negative(self, tracking_session):
+        """Un delta négatif commande la direction -1 et une rotation négative."""
+        tracking_session.encoder_available = False
+
+        with (
+            patch.object(tracking_session.moteur, 'definir_direction') as mock_dir,
+            patch.object(tracking_session.moteur, 'rotation') as mock_rotation,
+        ):
+            tracking_session._apply_correction_sans_feedback(-2.0, 0.002)
+
+        mock_dir.assert_called_once_with(-1)
+        assert isinstance(mock_dir.call_args[0][0], int)
+        assert mock_rotation.call_args[0][0] < 0
+
     def test_avec_feedback_normalise(self, tracking_session):
         """_finaliser_correction normalise via % 360."""
         tracking_session.position_relative = 350.0
@@ -322,7 +349,7 @@ class TestEncoderResync:
         mock_reader = MagicMock()
         mock_reader.read_angle.return_value = 130.0
 
-        with patch('core.hardware.daemon_encoder_reader.get_daemon_reader',
+        with patch('core.tracking.tracking_corrections_mixin.get_daemon_reader',
                    return_value=mock_reader):
             tracking_session._apply_correction_avec_feedback(35.0, 0.001)
 
@@ -354,7 +381,7 @@ class TestEncoderResync:
 
         mock_reader = MagicMock()
 
-        with patch('core.hardware.daemon_encoder_reader.get_daemon_reader',
+        with patch('core.tracking.tracking_corrections_mixin.get_daemon_reader',
                    return_value=mock_reader):
             tracking_session._apply_correction_avec_feedback(3.0, 0.001)
 
@@ -387,7 +414,7 @@ class TestMeridianTransitDetection:
         """Le log TRANSIT MÉRIDIEN est émis quand delta > LARGE_MOVEMENT_THRESHOLD."""
         tracking_session.running = True
         tracking_session.position_relative = 246.0
-        tracking_session.next_correction_time = None
+        tracking_session._next_correction_mono = 0.0
 
         # Mock pour forcer un grand delta (246° → 112° = -134°)
         tracking_session._calculate_current_coords = MagicMock(return_value=(180.0, 45.0))
@@ -405,7 +432,7 @@ class TestMeridianTransitDetection:
         """Pas de log transit pour les petits deltas."""
         tracking_session.running = True
         tracking_session.position_relative = 100.0
-        tracking_session.next_correction_time = None
+        tracking_session._next_correction_mono = 0.0
 
         tracking_session._calculate_current_coords = MagicMock(return_value=(180.0, 45.0))
         tracking_session._calculate_target_position = MagicMock(return_value=(102.0, {}))
@@ -416,7 +443,7 @@ class TestMeridianTransitDetection:
 
         # Pas de nouvel entry meridian_transit
         meridian_entries = [
-            e for e in tracking_session.drift_tracking['goto_log'][initial_goto_count:]
+            e for e in list(tracking_session.drift_tracking['goto_log'])[initial_goto_count:]
             if e.get('reason') == 'meridian_transit'
         ]
         assert len(meridian_entries) == 0
@@ -456,7 +483,7 @@ class TestLargeMovementFlag:
         mock_reader = MagicMock()
         mock_reader.read_angle.return_value = 135.0
 
-        with patch('core.hardware.daemon_encoder_reader.get_daemon_reader',
+        with patch('core.tracking.tracking_corrections_mixin.get_daemon_reader',
                    return_value=mock_reader):
             tracking_session._apply_correction_avec_feedback(35.0, 0.001)
 
@@ -5,7 +5,9 @@ Ce module teste le gestionnaire de session de suivi.
 Ces tests fonctionnent SANS astropy grâce au mocking des dépendances.
 """
 
+import logging
 import sys
+import time
 import pytest
 from datetime import datetime, timezone
 from collections import deque
@@ -299,7 +301,7 @@ class TestTrackingSessionEncoder:
             'pandas': MagicMock(),
             'core.tracking.abaque_manager': mock_abaque_module,
         }):
-            with patch('core.hardware.hardware_detector.HardwareDetector') as mock_hw:
+            with patch('core.tracking.tracker.HardwareDetector') as mock_hw:
                 mock_hw.check_encoder_daemon.return_value = (True, None, 45.0)
 
                 mock_reader = MagicMock()
@@ -323,6 +325,73 @@ class TestTrackingSessionEncoder:
 
                     assert session.encoder_available is True
 
+    def _mock_reader(self, angle=45.0):
+        reader = MagicMock()
+        reader.read_angle.return_value = angle
+        reader.read_status.return_value = {'angle': angle, 'status': 'OK', 'calibrated': True}
+        return reader
+
+    def _patch_reader(self, session, reader):
+        # Module du mixin retiré de sys.modules par la fixture : patcher ses globals
+        module_globals = type(session)._read_daemon_angle.__globals__
+        return patch.dict(module_globals, {'get_daemon_reader': lambda: reader})
+
+    def test_lectures_demon_enchainees_mises_en_cache(self, tracking_session):
+        """Vérification GOTO puis sync encodeur : une seule lecture démon de chaque type."""
+        tracking_session.encoder_available = True
+        reader = self._mock_reader(120.0)
+
+        with self._patch_reader(tracking_session, reader):
+            tracking_session._check_initial_goto(125.0)
+            tracking_session._sync_encoder(125.0)
+
+        assert reader.read_status.call_count == 1
+        assert reader.read_angle.call_count == 1
+        assert tracking_session.encoder_offset == 5.0
+
+    def test_lecture_demon_expiree_relue(self, tracking_session):
+        """Au-delà du TTL, l'angle est relu sur le démon."""
+        reader = self._mock_reader(120.0)
+
+        with self._patch_reader(tracking_session, reader):
+            tracking_session._read_daemon_angle()
+            tracking_session._daemon_cache['angle'] = (time.monotonic() - 1.0, 0.0)
+            angle = tracking_session._read_daemon_angle()
+
+        assert angle == 120.0
+        assert reader.read_angle.call_count == 2
+
+    def test_echec_lecture_demon_non_memorise(self, tracking_session):
+        """Une lecture en échec n'est pas mise en cache."""
+        reader = self._mock_reader()
+        reader.read_angle.side_effect = [RuntimeError("démon absent"), 45.0]
+
+        with self._patch_reader(tracking_session, reader):
+            with pytest.raises(RuntimeError):
+                tracking_session._read_daemon_angle()
+            assert tracking_session._read_daemon_angle() == 45.0
+
+    def test_correction_vide_cache_demon(self, tracking_session):
+        """Après une correction, la prochaine lecture démon est fraîche."""
+        tracking_session.encoder_available = False
+        tracking_session._daemon_cache['angle'] = (time.monotonic(), 120.0)
+
+        tracking_session._apply_correction(1.0)
+
+        assert tracking_session._daemon_cache == {}
+
+    def test_goto_initial_vide_cache_demon(self, tracking_session):
+        """La lecture d'avant GOTO n'est pas resservie après le déplacement."""
+        tracking_session.encoder_available = False
+        reader = self._mock_reader(120.0)
+
+        with self._patch_reader(tracking_session, reader):
+            tracking_session._execute_initial_goto(150.0, 0.002)
+            tracking_session._read_daemon_angle()
+
+        tracking_session.moteur.rotation.assert_called_once()
+        assert reader.read_angle.call_count == 2
+
 
 # =============================================================================
 # TESTS CALCUL COORDONNÉES
@@ -344,6 +413,37 @@ class TestCalculateCurrentCoords:
         assert az == 120.0
         assert alt == 45.0
 
+    def test_planete_radec_reutilisees_dans_la_tranche(self, tracking_session):
+        """Deux calculs exacts dans la même minute n'appellent qu'une fois les éphémérides."""
+        tracking_session.is_planet = True
+        tracking_session._objet_cap = "Jupiter"
+        ephem = MagicMock()
+        ephem.get_planet_position.return_value = (60.0, 20.0)
+        tracking_session._ephemerides = ephem
+
+        tracking_session._compute_current_coords(datetime(2025, 6, 21, 22, 0, 5))
+        tracking_session._compute_current_coords(datetime(2025, 6, 21, 22, 0, 50))
+        assert ephem.get_planet_position.call_count == 1
+
+        tracking_session._compute_current_coords(datetime(2025, 6, 21, 22, 1, 5))
+        assert ephem.get_planet_position.call_count == 2
+
+    def test_planete_echec_non_memorise(self, tracking_session):
+        """Un échec des éphémérides n'est pas mis en cache (nouvel essai au calcul suivant)."""
+        tracking_session.is_planet = True
+        tracking_session._objet_cap = "Jupiter"
+        tracking_session.ra_deg = 60.0
+        tracking_session.dec_deg = 20.0
+        ephem = MagicMock()
+        ephem.get_planet_position.return_value = None
+        tracking_session._ephemerides = ephem
+
+        now = datetime(2025, 6, 21, 22, 0, 5)
+        tracking_session._compute_current_coords(now)
+        tracking_session._compute_current_coords(now)
+
+        assert ephem.get_planet_position.call_count == 2
+
 
 # =============================================================================
 # TESTS STATISTIQUES ET ÉTAT
@@ -366,7 +466,115 @@ class TestTrackingSessionState:
         """Structure du suivi de dérive."""
         assert 'start_time' in tracking_session.drift_tracking
         assert 'corrections_log' in tracking_session.drift_tracking
-        assert isinstance(tracking_session.drift_tracking['corrections_log'], list)
+        assert isinstance(tracking_session.drift_tracking['corrections_log'], deque)
+
+    def test_echantillonnage_position_horloge_monotone(self, tracking_session):
+        """L'intervalle d'échantillonnage (30 s) est mesuré sur time.monotonic()."""
+        module_time = type(tracking_session)._log_position_sample.__globals__['time']
+        with patch.object(module_time, 'monotonic', side_effect=[1000.0, 1010.0, 1031.0]):
+            for _ in range(3):
+                tracking_session._log_position_sample(180.0, 45.0, 102.0, 'continuous')
+
+        position_log = tracking_session.drift_tracking['position_log']
+        assert len(position_log) == 2
+        assert isinstance(position_log[0]['timestamp'], str)
+
+    def test_temps_par_mode_horloge_monotone(self, tracking_session):
+        """Le temps en mode continu cumule les écarts de time.monotonic()."""
+        module_time = type(tracking_session)._update_mode_time.__globals__['time']
+        with patch.object(module_time, 'monotonic', side_effect=[500.0, 530.0, 575.5]):
+            for _ in range(3):
+                tracking_session._update_mode_time('continuous')
+
+        assert tracking_session._mode_time_counters['continuous'] == pytest.approx(75.5)
+
+    def test_journaux_position_et_goto_bornes(self, tracking_session):
+        """position_log et goto_log ont une taille maximale (sessions longues)."""
+        position_log = tracking_session.drift_tracking['position_log']
+        goto_log = tracking_session.drift_tracking['goto_log']
+
+        assert position_log.maxlen == tracking_session.MAX_POSITION_LOG
+        assert goto_log.maxlen == tracking_session.MAX_GOTO_LOG
+
+        for i in range(goto_log.maxlen + 2):
+            tracking_session._log_goto(0.0, 10.0, 10.0, 'initial')
+        assert len(goto_log) == goto_log.maxlen
+
+    def test_position_relative_normalisee_a_l_ecriture(self, tracking_session):
+        """_set_position_relative ramène la position dans [0, 360[."""
+        tracking_session._set_position_relative(370.0)
+        assert tracking_session.position_relative == pytest.approx(10.0)
+
+        tracking_session._set_position_relative(-10.0)
+        assert tracking_session.position_relative == pytest.approx(350.0)
+
+    def test_session_data_start_time_iso(self, tracking_session):
+        """get_session_data renvoie l'heure de début formatée au démarrage."""
+        debut = datetime(2025, 6, 21, 22, 0, 0)
+        tracking_session._set_start_time(debut, time.monotonic())
+
+        data = tracking_session.get_session_data()
+
+        assert data['start_time'] == debut.isoformat()
+        assert tracking_session.drift_tracking['start_time'] == debut
+
+    def test_session_data_duree_horloge_monotone(self, tracking_session):
+        """La durée de session se mesure sur time.monotonic(), pas sur l'heure murale."""
+        tracking_session._set_start_time(datetime(2020, 1, 1, 0, 0, 0), time.monotonic() - 125.0)
+
+        data = tracking_session.get_session_data()
+
+        assert data['duration_seconds'] == 125
+
+    def test_duree_session_inclut_goto_initial(self, tracking_session):
+        """L'horloge de début est celle lue avant le GOTO initial, pas après."""
+        tracking_session.ra_deg = 250.0
+        tracking_session.dec_deg = 36.0
+        debut_mono = time.monotonic() - 240.0  # GOTO de 4 min
+        tracking_session._start_tracking("M13", datetime.now(), debut_mono)
+
+        assert tracking_session._start_mono == debut_mono
+        assert tracking_session.get_session_data()['duration_seconds'] == 240
+
+    def test_corrections_log_borne(self, tracking_session):
+        """Le journal des corrections garde au plus MAX_CORRECTIONS_LOG entrées."""
+        log = tracking_session.drift_tracking['corrections_log']
+        assert log.maxlen == tracking_session.MAX_CORRECTIONS_LOG
+
+        for i in range(log.maxlen + 5):
+            log.append({'correction': i})
+
+        assert len(log) == log.maxlen
+        assert log[0] == {'correction': 5}
+
+    def test_journal_plein_avertit_une_fois(self, tracking_session, caplog):
+        """L'éviction d'anciennes corrections est signalée une seule fois."""
+        import logging
+        tracking_session.drift_tracking['corrections_log'] = deque(maxlen=3)
+
+        with caplog.at_level(logging.WARNING, logger='core.tracking.tracker'):
+            for i in range(6):
+                tracking_session._log_correction({'correction': i})
+
+        log = tracking_session.drift_tracking['corrections_log']
+        assert list(log) == [{'correction': i} for i in (3, 4, 5)]
+        avertissements = [r for r in caplog.records if "Journal des corrections plein" in r.message]
+        assert len(avertissements) == 1
+
+    def test_session_data_logs_tronques(self, tracking_session):
+        """max_log_entries ne renvoie que les dernières entrées, en listes."""
+        for i in range(10):
+            tracking_session.drift_tracking['corrections_log'].append({'correction': i})
+            tracking_session.drift_tracking['goto_log'].append({'delta': i})
+
+        data = tracking_session.get_session_data(max_log_entries=3)
+        complet = tracking_session.get_session_data()
+
+        assert data['corrections_log'] == [{'correction': i} for i in (7, 8, 9)]
+        assert data['goto_log'] == [{'delta': i} for i in (7, 8, 9)]
+        assert data['position_log'] == []
+        assert isinstance(complet['corrections_log'], list)
+        assert len(complet['corrections_log']) == 10
 
 
 # =============================================================================
@@ -416,6 +624,43 @@ class TestAbaqueIntegration:
         tracking_session.abaque_manager.get_dome_position.assert_called()
         assert result == 130.0
 
+    def test_calculate_target_position_memoise(self, tracking_session):
+        """Deux appels à coordonnées quasi identiques n'interpolent qu'une fois."""
+        get_dome = tracking_session.abaque_manager.get_dome_position
+
+        pos1, _ = tracking_session._calculate_target_position(120.001, 45.002)
+        pos2, infos = tracking_session._calculate_target_position(120.003, 44.999)
+
+        assert pos1 == pos2
+        assert get_dome.call_count == 1
+        get_dome.assert_called_once_with(45.0, 120.0)
+        assert infos["method"] == "abaque"
+
+    def test_calculate_target_position_infos_lecture_seule(self, tracking_session):
+        """Les infos mises en cache ne peuvent pas être modifiées par l'appelant."""
+        _, infos = tracking_session._calculate_target_position(121.0, 46.0)
+
+        with pytest.raises(TypeError):
+            infos["method"] = "autre"
+
+    def test_calculate_target_position_memo_borne(self, tracking_session):
+        """Au-delà de TARGET_MEMO_MAX, l'entrée la plus ancienne est évincée."""
+        tracking_session.TARGET_MEMO_MAX = 2
+
+        for az in (120.0, 121.0, 122.0):
+            tracking_session._calculate_target_position(az, 45.0)
+
+        assert list(tracking_session._target_memo) == [(45.0, 121.0), (45.0, 122.0)]
+
+    def test_calculate_target_position_memo_par_session(self, tracking_session):
+        """Le memo appartient à la session : un nouvel abaque repart à vide."""
+        tracking_session._calculate_target_position(120.0, 45.0)
+        assert tracking_session._target_memo
+
+        tracking_session._init_abaque("data/Loi_coupole.xlsx")
+
+        assert tracking_session._target_memo == {}
+
 
 # =============================================================================
 # TESTS MODE UNIQUE v5.10
@@ -428,6 +673,10 @@ class TestSingleModeTracking:
         """La session expose MODE_NAME = 'continuous'."""
         assert tracking_session.MODE_NAME == 'continuous'
 
+    def test_mode_icon_precalculee(self, tracking_session):
+        """L'icône du mode unique est résolue depuis MODE_ICONS."""
+        assert tracking_session.MODE_ICON == tracking_session.MODE_ICONS['continuous']
+
 
 # =============================================================================
 # TESTS GET STATUS
@@ -444,6 +693,211 @@ class TestGetStatus:
         assert isinstance(status, dict)
         assert status.get('running') is False
 
+    def _start_fake_tracking(self, session):
+        session.running = True
+        session.objet = "M13"
+        session.ra_deg = 250.0
+        session.dec_deg = 36.0
+        session._schedule_next_correction(30)
+
+    def test_get_status_mis_en_cache(self, tracking_session):
+        """Deux polls rapprochés ne recalculent pas les coordonnées."""
+        self._start_fake_tracking(tracking_session)
+
+        with patch.object(
+            tracking_session, '_calculate_current_coords', return_value=(120.0, 45.0)
+        ) as mock_coords:
+            status1 = tracking_session.get_status()
+            status2 = tracking_session.get_status()
+
+        assert mock_coords.call_count == 1
+        assert status1 == status2
+        assert status1 is not status2
+
+    def test_get_status_invalide_recalcule(self, tracking_session):
+        """Après invalidation, le statut est recalculé."""
+        self._start_fake_tracking(tracking_session)
+
+        with patch.object(
+            tracking_session, '_calculate_current_coords', return_value=(120.0, 45.0)
+        ) as mock_coords:
+            tracking_session.get_status()
+            tracking_session._invalidate_status_cache()
+            tracking_session.get_status()
+
+        assert mock_coords.call_count == 2
+
+    def test_get_status_depuis_gabarit(self, tracking_session):
+        """Le statut reprend les clés constantes du gabarit, sans l'exposer."""
+        self._start_fake_tracking(tracking_session)
+        tracking_session._start_tracking("M13", datetime.now(), time.monotonic())
+
+        with patch.object(
+            tracking_session, '_calculate_current_coords', return_value=(120.0, 45.0)
+        ):
+            status = tracking_session.get_status()
+
+        assert status['objet'] == "M13"
+        assert status['mode_icon'] == tracking_session.MODE_ICON
+        assert status['obj_az_raw'] == 120.0
+        assert status is not tracking_session._status_template
+
+    def test_get_status_reutilise_calcul_de_start(self, tracking_session):
+        """Le premier poll après start() réutilise la position déjà calculée."""
+        self._start_fake_tracking(tracking_session)
+        tracking_session._prime_status_cache(
+            120.0, 45.0, 125.0, {'method': 'interpolation'}, time.monotonic()
+        )
+
+        with patch.object(tracking_session, '_calculate_current_coords') as mock_coords:
+            status = tracking_session.get_status()
+
+        mock_coords.assert_not_called()
+        assert status['obj_az_raw'] == 120.0
+        assert status['position_cible'] == 125.0
+
+    def test_get_status_amorce_perimee_recalcule(self, tracking_session):
+        """Un calcul de start() plus vieux que le TTL (long GOTO) est ignoré."""
+        self._start_fake_tracking(tracking_session)
+        tracking_session._prime_status_cache(
+            120.0, 45.0, 125.0, {}, time.monotonic() - 60
+        )
+
+        with patch.object(
+            tracking_session, '_calculate_current_coords', return_value=(121.0, 45.0)
+        ) as mock_coords:
+            status = tracking_session.get_status()
+
+        mock_coords.assert_called_once()
+        assert status['obj_az_raw'] == 121.0
+
+    def test_amorce_perimee_un_seul_echantillon_lisse(self, tracking_session):
+        """Amorce expirée puis poll : un seul échantillon entre dans le lissage."""
+        self._start_fake_tracking(tracking_session)
+
+        with patch.object(
+            tracking_session, '_smooth_position_cible', side_effect=lambda p: p
+        ) as mock_smooth, patch.object(
+            tracking_session, '_calculate_current_coords', return_value=(121.0, 45.0)
+        ):
+            tracking_session._prime_status_cache(
+                120.0, 45.0, 125.0, {}, time.monotonic() - 60
+            )
+            mock_smooth.assert_not_called()
+            tracking_session.get_status()
+
+        mock_smooth.assert_called_once()
+
+    def test_get_status_temps_restant_monotone(self, tracking_session):
+        """Le temps restant est calculé sur l'horloge monotone."""
+        self._start_fake_tracking(tracking_session)
+
+        with patch.object(
+            tracking_session, '_calculate_current_coords', return_value=(120.0, 45.0)
+        ):
+            status = tracking_session.get_status()
+
+        assert 28 <= status['remaining_seconds'] <= 30
+
+
+class TestCorrectionScheduling:
+    """Tests pour la planification des corrections (horloge monotone)."""
+
+    def test_check_and_correct_respecte_echeance(self, tracking_session):
+        """Une vérification planifiée dans le futur n'est pas exécutée."""
+        tracking_session.running = True
+        tracking_session._calculate_current_coords = MagicMock(return_value=(180.0, 45.0))
+        tracking_session._calculate_target_position = MagicMock(return_value=(102.0, {}))
+        tracking_session._apply_correction = MagicMock()
+
+        tracking_session._schedule_next_correction(30)
+        applied, _ = tracking_session.check_and_correct()
+
+        assert applied is False
+        tracking_session._calculate_current_coords.assert_not_called()
+
+    def test_correction_planifie_prochaine_verification(self, tracking_session):
+        """Après une correction, la prochaine échéance est repoussée."""
+        tracking_session.running = True
+        tracking_session.position_relative = 100.0
+        tracking_session._calculate_current_coords = MagicMock(return_value=(180.0, 45.0))
+        tracking_session._calculate_target_position = MagicMock(return_value=(102.0, {}))
+        tracking_session._apply_correction = MagicMock()
+
+        applied, _ = tracking_session.check_and_correct()
+
+        assert applied is True
+        assert tracking_session._next_correction_mono > time.monotonic()
+
+    def test_status_reutilise_calcul_de_la_verification(self, tracking_session):
+        """Le get_status() qui suit une vérification ne recalcule pas la position."""
+        tracking_session.running = True
+        tracking_session.position_relative = 102.0
+        tracking_session._calculate_current_coords = MagicMock(return_value=(180.0, 45.0))
+        tracking_session._calculate_target_position = MagicMock(return_value=(102.1, {}))
+
+        applied, _ = tracking_session.check_and_correct()
+        status = tracking_session.get_status()
+
+        assert applied is False
+        assert tracking_session._calculate_current_coords.call_count == 1
+        assert status['obj_az_raw'] == 180.0
+        assert status['position_cible'] == 102.1
+
+    def test_message_skip_formate_une_fois(self, tracking_session, caplog):
+        """Le message renvoyé sur un skip est celui du log DEBUG, sans next_check."""
+        tracking_session.running = True
+        tracking_session.position_relative = 102.0
+        tracking_session._calculate_current_coords = MagicMock(return_value=(180.0, 45.0))
+        tracking_session._calculate_target_position = MagicMock(return_value=(102.1, {}))
+
+        with caplog.at_level(logging.DEBUG, logger=tracking_session.logger.name):
+            applied, message = tracking_session.check_and_correct()
+
+        assert applied is False
+        assert message.startswith("correction_skip | delta=+0.10 threshold=")
+        assert "next_check" not in message
+        assert any(
+            r.getMessage().startswith(message + " next_check=") for r in caplog.records
+        )
+
+
+class TestRechercheObjet:
+    """Tests pour _rechercher_objet (catalogue partagé entre sessions)."""
+
+    @pytest.fixture
+    def catalogue_globals(self, tracking_session):
+        """Globals du module goto avec un catalogue factice."""
+        catalogue = MagicMock()
+        catalogue.rechercher.return_value = {'ra_deg': 83.8, 'dec_deg': -5.4}
+        factory = MagicMock(return_value=catalogue)
+        module_globals = type(tracking_session)._rechercher_objet.__globals__
+        with patch.dict(module_globals, {
+            'GestionnaireCatalogue': factory,
+            '_catalogue': None,
+        }):
+            yield factory, catalogue
+
+    def test_catalogue_construit_une_seule_fois(self, tracking_session, catalogue_globals):
+        """Deux recherches successives réutilisent le même catalogue."""
+        factory, catalogue = catalogue_globals
+
+        assert tracking_session._rechercher_objet("M42") == (True, "")
+        assert tracking_session._rechercher_objet("M31") == (True, "")
+
+        factory.assert_called_once()
+        assert catalogue.rechercher.call_count == 2
+
+    def test_catalogue_partage_verifie_le_cache(self, tracking_session, catalogue_globals):
+        """Les recherches suivantes demandent un rechargement si le cache a changé."""
+        factory, catalogue = catalogue_globals
+
+        tracking_session._rechercher_objet("M42")
+        tracking_session._rechercher_objet("M42")
+
+        factory.assert_called_once()
+        catalogue.recharger_si_modifie.assert_called_once()
+
 
 # =============================================================================
 # TESTS PARAMÈTRES CORRECTIONS
@@ -497,6 +951,98 @@ class TestSmoothPositionCible:
         # Devrait retourner 180.0 directement (reset)
         assert result == 180.0
 
+    def test_valeur_repetee_court_circuit(self, tracking_session):
+        """Fenêtre remplie d'une même valeur : retour direct, fenêtre inchangée."""
+        for _ in range(5):
+            lisse = tracking_session._smooth_position_cible(120.25)
+        somme = tracking_session._position_cible_sum
+        # Module cmath tel que vu par le mixin (sys.modules est manipulé par les fixtures)
+        cmath = type(tracking_session)._smooth_position_cible.__globals__['cmath']
+
+        with patch.object(cmath, 'rect', wraps=cmath.rect) as rect:
+            result = tracking_session._smooth_position_cible(120.25)
+            rect.assert_not_called()
+            assert tracking_session._position_cible_sum == somme
+            # Contrôle : une valeur différente construit bien un vecteur
+            tracking_session._smooth_position_cible(120.5)
+            rect.assert_called_once()
+
+        assert result == lisse == pytest.approx(120.25)
+
+    def test_valeur_repetee_fenetre_incomplete_lissee(self, tracking_session):
+        """Tant que la fenêtre contient d'autres valeurs, la répétition est lissée."""
+        import math
+        valeurs = [100.0, 101.0, 101.0, 101.0, 101.0, 101.0]
+        for v in valeurs:
+            result = tracking_session._smooth_position_cible(v)
+
+        assert result == pytest.approx(101.0, abs=1e-9)
+        tracking_session._smooth_position_cible(102.0)
+        fenetre = [101.0, 101.0, 101.0, 101.0, 102.0]
+        attendu = math.degrees(math.atan2(
+            sum(math.sin(math.radians(p)) for p in fenetre),
+            sum(math.cos(math.radians(p)) for p in fenetre),
+        )) % 360
+        assert tracking_session._cached_position_cible == pytest.approx(attendu, abs=1e-9)
+
+    def test_fenetre_glissante_somme_incrementale(self, tracking_session):
+        """Au-delà de 5 valeurs, seule la fenêtre des 5 dernières compte."""
+        import math
+        valeurs = [359.0, 1.0, 358.5, 2.0, 0.5, 3.0, 1.5]
+        for v in valeurs:
+            result = tracking_session._smooth_position_cible(v)
+
+        fenetre = valeurs[-5:]
+        attendu = math.degrees(math.atan2(
+            sum(math.sin(math.radians(p)) for p in fenetre),
+            sum(math.cos(math.radians(p)) for p in fenetre),
+        )) % 360
+        assert result == pytest.approx(attendu, abs=1e-9)
+
+    def test_equivalent_recalcul_complet(self, tracking_session):
+        """Les sommes incrémentales donnent le même résultat qu'un re-calcul complet."""
+        import math
+        import random
+        from collections import deque
+
+        rng = random.Random(42)
+        history = deque(maxlen=5)
+        cached = None
+        position = 357.0
+        for i in range(300):
+            # Bruit ±0.5° autour d'une dérive traversant 0/360, avec quelques sauts
+            position += 0.05 + rng.uniform(-0.5, 0.5) + (90.0 if i % 97 == 96 else 0.0)
+            new = position % 360
+            if cached is None or abs((new - cached + 180) % 360 - 180) > 10:
+                history.clear()
+                history.append(new)
+                attendu = new
+            else:
+                history.append(new)
+                attendu = math.degrees(math.atan2(
+                    sum(math.sin(math.radians(p)) for p in history),
+                    sum(math.cos(math.radians(p)) for p in history),
+                )) % 360
+            cached = attendu
+
+            result = tracking_session._smooth_position_cible(position)
+            ecart = (result - attendu + 180) % 360 - 180
+            assert abs(ecart) < 1e-9
+
+    def test_delta_circulaire_traverse_zero(self, tracking_session):
+        """359.9° → 0.1° est un petit écart (lissé), pas un saut de 359.8°."""
+        tracking_session._smooth_position_cible(359.9)
+        result = tracking_session._smooth_position_cible(0.1)
+
+        assert result == pytest.approx(0.0, abs=1e-9) or result == pytest.approx(360.0)
+
+    def test_delta_demi_tour_reset(self, tracking_session):
+        """Un écart de ±180° (bornes du delta circulaire) déclenche le reset."""
+        tracking_session._smooth_position_cible(10.0)
+        assert tracking_session._smooth_position_cible(190.0) == 190.0
+        assert tracking_session._smooth_position_cible(10.0) == 10.0
+        assert len(tracking_session._position_cible_history) == 1
+
     def test_normalisation_360(self, tracking_session):
         """Les angles sont normalisés dans [0, 360)."""
         result = tracking_session._smooth_position_cible(400.0)
@@ -227,3 +227,47 @@ class TestRechercherObjet:
         if success:
             assert session.ra_deg is not None
             assert session.dec_deg is not None
+
+    def test_ephemerides_creees_une_seule_fois(self, session):
+        """Les éphémérides planétaires sont instanciées une fois puis réutilisées."""
+        assert session._ephemerides is None
+        ephemerides = session._get_ephemerides()
+        assert ephemerides is not None
+        assert session._get_ephemerides() is ephemerides
+
+    def test_nom_capitalise_precalcule(self, session):
+        """Le nom capitalisé de l'objet est calculé une fois lors de la recherche."""
+        success, msg = session._rechercher_objet("jupiter")
+        if success:
+            assert session._objet_cap == "Jupiter"
+
+
+# =============================================================================
+# Interpolation des coordonnées
+# =============================================================================
+
+class TestInterpolationCoords:
+    def test_interpolation_entre_ancres(self, session):
+        """Entre deux ancres, Az/Alt interpolés restent au centième de degré du calcul exact."""
+        session.ra_deg = 250.0
+        session.dec_deg = 36.0
+        t0 = datetime(2025, 6, 21, 22, 0, 0)
+        session._calculate_current_coords(t0)
+        assert session._coords_anchors is not None
+
+        t = datetime(2025, 6, 21, 22, 0, 30)
+        az, alt = session._calculate_current_coords(t)
+        az_exact, alt_exact = session._compute_current_coords(t)
+
+        assert az == pytest.approx(az_exact, abs=0.01)
+        assert alt == pytest.approx(alt_exact, abs=0.01)
+
+    def test_ancres_renouvelees_hors_fenetre(self, session):
+        """Un instant hors de la fenêtre d'ancrage déclenche un calcul exact."""
+        session.ra_deg = 250.0
+        session.dec_deg = 36.0
+        session._calculate_current_coords(datetime(2025, 6, 21, 22, 0, 0))
+
+        t = datetime(2025, 6, 21, 22, 5, 0)
+        assert session._calculate_current_coords(t) == session._compute_current_coords(t)
+        assert session._coords_anchors[0] == t.timestamp()
@@ -34,6 +34,7 @@ class ConcreteTrackingCorrections(TrackingCorrectionsMixin):
         self.total_movement = 0.0
         self.is_large_movement_in_progress = False
         self.failed_feedback_count = 0
+        self._degraded_mode_notified = False
         # Mock du moteur avec rotation_avec_feedback
         self.moteur = MagicMock()
         self.moteur.rotation_avec_feedback.return_value = {
@@ -47,6 +48,10 @@ class ConcreteTrackingCorrections(TrackingCorrectionsMixin):
             "corrections": [],
         }
 
+    def _set_position_relative(self, position: float):
+        """Méthode de TrackingStateMixin attendue par le mixin."""
+        self.position_relative = position % 360
+
 
 # =============================================================================
 # FIXTURES
@@ -215,3 +220,93 @@ class TestMeridianTransitLog:
         """Un delta < LARGE_MOVEMENT_THRESHOLD ne déclenche PAS de log méridien."""
         delta = 5.0
         assert abs(delta) <= mixin.LARGE_MOVEMENT_THRESHOLD
+
+
+# =============================================================================
+# TESTS LOG DÉTAIL ITÉRATIONS
+# =============================================================================
+
+
+class TestLogDetailIterations:
+    """Tests pour _log_detail_iterations (un seul enregistrement DEBUG)."""
+
+    RESULT = {
+        "iterations": 3,
+        "corrections": [
+            {"iteration": 1, "correction_demandee": 2.0, "erreur_avant": 2.0, "erreur_apres": 0.6},
+            {"iteration": 2, "correction_demandee": 0.6, "erreur_avant": 0.6, "erreur_apres": 0.2},
+        ],
+    }
+
+    def test_un_seul_enregistrement_multilignes(self, mixin, caplog):
+        """Toutes les itérations sont regroupées dans un seul log DEBUG."""
+        with caplog.at_level(logging.DEBUG, logger="test.tracking_corrections"):
+            mixin._log_detail_iterations(self.RESULT)
+
+        assert len(caplog.records) == 1
+        lines = caplog.records[0].getMessage().split("\n")
+        assert lines[0] == "  Détail corrections:"
+        assert lines[1].startswith("    Iter 1: +2.00°")
+        assert len(lines) == 3
+
+    def test_rien_si_debug_desactive(self, mixin, caplog):
+        """Niveau INFO : aucun log (et aucun formatage)."""
+        with caplog.at_level(logging.INFO, logger="test.tracking_corrections"):
+            mixin._log_detail_iterations(self.RESULT)
+
+        assert caplog.records == []
+
+
+class TestLogFeedback:
+    """Tests pour les logs de résultat feedback (arguments %-différés)."""
+
+    RESULT = {
+        "position_initiale": 100.0,
+        "position_finale": 123.04,
+        "position_cible": 123.0,
+        "erreur_finale": 0.04,
+        "iterations": 2,
+    }
+
+    def test_message_succes(self, mixin, caplog):
+        """Le message de succès garde le format historique."""
+        with caplog.at_level(logging.INFO, logger="test.tracking_corrections"):
+            mixin._log_feedback_succes(self.RESULT, 1.25)
+
+        assert caplog.records[0].getMessage() == (
+            "Correction feedback réussie: 100.0° -> 123.0° (erreur: 0.04°, "
+            "AZCoupole: 123.0°, 2/10 iter, 1.2s)"
+        )
+
+    def test_message_echec_compte_les_echecs(self, mixin, caplog):
+        """Le message d'échec inclut le compteur d'échecs consécutifs."""
+        mixin.max_failed_feedback = 3
+        with caplog.at_level(logging.WARNING, logger="test.tracking_corrections"):
+            mixin._log_feedback_echec(self.RESULT, 2.0)
+
+        assert caplog.records[0].getMessage().endswith("[1/3 échecs]")
+
+    def test_message_timeout_acceptable(self, mixin, caplog):
+        """Le timeout acceptable partage le format commun, avec son suffixe."""
+        mixin.failed_feedback_count = 1
+        with caplog.at_level(logging.WARNING, logger="test.tracking_corrections"):
+            mixin._log_feedback_timeout_acceptable(self.RESULT, 30.0)
+
+        assert caplog.records[0].getMessage() == (
+            "Correction longue mais acceptable: 100.0° -> 123.0° (erreur: 0.04°, "
+            "AZCoupole: 123.0°, 2/10 iter, 30.0s) [timeout OK, erreur < 2.0°]"
+        )
+        assert mixin.failed_feedback_count == 1
+
+
+class TestNotifyDegradedMode:
+    """Tests pour _notify_degraded_mode (avertissement unique)."""
+
+    def test_avertissement_emis_une_seule_fois(self, mixin, caplog):
+        """Plusieurs fallbacks successifs ne produisent qu'un seul warning."""
+        with caplog.at_level(logging.WARNING, logger="test.tracking_corrections"):
+            mixin._notify_degraded_mode()
+            mixin._notify_degraded_mode()
+
+        assert len(caplog.records) == 1
+        assert mixin._degraded_mode_notified is True
@@ -88,3 +88,13 @@ class TestTrackingLogger:
         with caplog.at_level(logging.DEBUG, logger="core.tracking.tracking_logger"):
             tracker_logger.log_position(180.0, 45.0, 0.002, "horaire")
         assert "POS" in caplog.text
+
+    def test_log_position_format_differe(self, tracker_logger, caplog):
+        with caplog.at_level(logging.DEBUG, logger="core.tracking.tracking_logger"):
+            tracker_logger.log_position(180.0, 45.0, 0.002, "horaire")
+        record = caplog.records[0]
+        # Arguments transmis au logging (formatage seulement si le record est émis)
+        assert record.args == (180.0, 45.0, 0.002, "horaire")
+        assert record.getMessage() == (
+            "POS | Az:  180.00° | Alt:  45.00° | V: 0.0020 t/j | Dir: horaire   "
+        )
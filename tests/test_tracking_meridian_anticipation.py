@@ -15,6 +15,7 @@ build_lookahead_trajectory pour isoler l'orchestration de astropy/abaque
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
@@ -63,6 +64,10 @@ class _SessionStub(TrackingMeridianAnticipationMixin):
         """Stub de la méthode de TrackingCorrectionsMixin."""
         self._resync_called_with = position_cible_logique
 
+    def _set_position_relative(self, position: float):
+        """Stub de la méthode de TrackingStateMixin."""
+        self.position_relative = position % 360
+
 
 @pytest.fixture
 def sample_flip() -> FlipInfo:
@@ -324,7 +329,7 @@ class TestCheckAndCorrectHook:
                 meridian_anticipation_config=MeridianAnticipationConfig(enabled=enabled),
             )
             session.running = True
-            session.next_correction_time = None
+            session._next_correction_mono = 0.0
             session.position_relative = 100.0
             session.objet = "TEST"
             return session
@@ -344,7 +349,7 @@ class TestCheckAndCorrectHook:
         mock_calc.assert_not_called()
         session.moteur.rotation_absolue.assert_called_once()
         assert session._anticipation_consumed is True
-        assert session.next_correction_time is not None
+        assert session._next_correction_mono > time.monotonic()
 
     def test_hook_noop_when_disabled(self):
         session = self._build_session(enabled=False)
@@ -354,6 +359,19 @@ class TestCheckAndCorrectHook:
         # (ici on s'arrête avant : _calculate_current_coords serait appelé ensuite).
         assert session._should_execute_anticipatory_slew(datetime.utcnow()) is False
 
+    def test_hook_saute_quand_desactive(self):
+        """Flag off : ni re-scan ni test de slew, on atteint directement le gate."""
+        session = self._build_session(enabled=False)
+        session._next_correction_mono = time.monotonic() + 60.0
+
+        with patch.object(session, "_maybe_rescan_anticipation") as mock_rescan, \
+                patch.object(session, "_should_execute_anticipatory_slew") as mock_due:
+            applied, msg = session.check_and_correct()
+
+        assert (applied, msg) == (False, "")
+        mock_rescan.assert_not_called()
+        mock_due.assert_not_called()
+
 
 # ============================================================================
 # Re-scan glissant (v5.11.1)
@@ -304,6 +304,42 @@ class TestMotorStatusView:
         assert response.data["calibration"] == status_payload["calibration"]
 
 
+    def test_status_meridien_fourni_par_motor_service(self, api_client, mock_ipc):
+        """Le temps avant méridien du Motor Service est renvoyé sans recalcul."""
+        import hardware.views as routed
+        status_payload = {
+            "status": "tracking",
+            "tracking_info": {
+                "ra_deg": 83.8,
+                "dec_deg": -5.4,
+                "meridian_seconds": 1200,
+                "meridian_time": "23h15",
+            },
+        }
+        with (
+            patch.object(routed.motor_client, "get_motor_status", return_value=status_payload),
+            patch("core.observatoire.AstronomicalCalculations") as mock_calc,
+        ):
+            response = api_client.get("/api/hardware/status/")
+
+        assert response.data["tracking_info"]["meridian_seconds"] == 1200
+        assert response.data["tracking_info"]["meridian_time"] == "23h15"
+        mock_calc.assert_not_called()
+
+    def test_status_meridien_calcule_si_absent(self, api_client, mock_ipc):
+        """Sans temps méridien dans le statut, la vue le calcule."""
+        import hardware.views as routed
+        status_payload = {
+            "status": "tracking",
+            "tracking_info": {"ra_deg": 83.8, "dec_deg": -5.4},
+        }
+        with patch.object(routed.motor_client, "get_motor_status", return_value=status_payload):
+            response = api_client.get("/api/hardware/status/")
+
+        assert isinstance(response.data["tracking_info"]["meridian_seconds"], int)
+        assert "h" in response.data["tracking_info"]["meridian_time"]
+
+
 class TestCalibrateView:
     """v6.4 Phase 3 Plan 01 — POST /api/hardware/calibrate/ remplace stub 501."""
 
@@ -226,9 +226,14 @@ class MotorStatusView(APIView):
     def get(self, request):
         data = motor_client.get_motor_status()
 
-        # Enrichir avec le temps avant passage au méridien
+        # Enrichir avec le temps avant passage au méridien, sauf s'il est déjà
+        # fourni par le Motor Service (calculé à chaque mise à jour du suivi)
         tracking_info = data.get('tracking_info')
-        if tracking_info and tracking_info.get('ra_deg') is not None:
+        if (
+            tracking_info
+            and tracking_info.get('ra_deg') is not None
+            and 'meridian_seconds' not in tracking_info
+        ):
             from datetime import datetime
             from core.observatoire import AstronomicalCalculations
             from core.config.config import get_site_config
@@ -244,7 +249,7 @@ class MotorStatusView(APIView):
             tracking_info['meridian_seconds'] = round(-ha * 239.3447)
 
             passage = calc.calculer_heure_passage_meridien(
-                tracking_info['ra_deg'], now, declinaison=dec_deg
+                tracking_info['ra_deg'], now, declinaison=dec_deg, angle_horaire=ha
             )
             tracking_info['meridian_time'] = passage.strftime('%Hh%M')
 
@@ -142,7 +142,7 @@ class ObjectSearchView(APIView):
                 result['meridian_seconds'] = round(-ha * 239.3447)
 
                 passage = calc.calculer_heure_passage_meridien(
-                    ra_deg, now, declinaison=dec_deg
+                    ra_deg, now, declinaison=dec_deg, angle_horaire=ha
                 )
                 result['meridian_time'] = passage.strftime('%Hh%M')
 